@@ -4,18 +4,38 @@ This module provides an MCP server that exposes task management functionality
 to AI agents through tools with User Elicitation for interactive forms.
 """
 
+import asyncio
+import base64
+import json
 import os
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
 from datetime import date, datetime
+from functools import lru_cache, wraps
+from itertools import islice
+from pathlib import Path
 from typing import Literal
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from fastmcp import FastMCP, Context
+from fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
+from sqlalchemy import Engine
+from sqlmodel import Session
 
-from taskmanager.database import get_session, init_db
-from taskmanager.models import Priority, Task, TaskStatus
+from taskmanager.config import get_settings
+from taskmanager.database import get_engine, init_db
+from taskmanager.models import TERMINAL_STATUSES, Priority, Task, TaskStatus, TaskSummary
 from taskmanager.repository_impl import SQLTaskRepository
 from taskmanager.service import TaskService
+from taskmanager.workspace import (
+    RG_BASE_ARGS,
+    RG_EXCLUDE_ARGS,
+    find_files_with_matches,
+    scan_workspace_files,
+)
 
 # Initialize FastMCP server
 mcp = FastMCP("Task Manager", version="0.1.0")
@@ -45,13 +65,47 @@ def get_default_profile() -> str:
     return os.environ.get("TASKMANAGER_PROFILE", "default")
 
 
-# Initialize all profile databases on startup
-for profile in ["default", "dev", "test"]:
-    init_db(profile)
+# Engines are shared process-wide (one connection pool per profile). Sessions are
+# not thread-safe, so each worker thread keeps its own TaskService per profile.
+_engines: dict[str, Engine] = {}
+_thread_services = threading.local()
+
+# Profiles whose database has been created/migrated by this process. Initialization
+# happens on first use of a profile instead of for every profile at import time.
+_initialized_profiles: set[str] = set()
+_init_lock = threading.Lock()
+
+
+def _get_profile_engine(profile: str) -> Engine:
+    """Return the shared engine for a profile, creating it on first use."""
+    engine = _engines.get(profile)
+    if engine is None:
+        engine = _engines.setdefault(profile, get_engine(profile))
+    return engine
+
+
+def _ensure_profile_initialized(profile: str) -> None:
+    """Run init_db for a profile once per process, on its first use.
+
+    The lock keeps concurrent first calls from migrating the same database twice.
+    """
+    if profile in _initialized_profiles:
+        return
+    with _init_lock:
+        if profile not in _initialized_profiles:
+            init_db(profile, engine=_get_profile_engine(profile))
+            _initialized_profiles.add(profile)
 
 
 def get_service(profile: str = None) -> TaskService:
-    """Create and return a TaskService instance for a specific profile.
+    """Return the cached TaskService instance for a specific profile.
+
+    The service, repository and session are built once per profile and thread,
+    then reused across tool calls. The profile's database is initialized on the
+    first call that uses it. The session is reset on each call so a tool
+    never sees rows left in the identity map by an earlier call; tasks are not
+    cached across calls (an interactive tool reads the task again after its
+    elicit round-trip, possibly on another worker thread).
 
     Args:
         profile: Database profile to use (default, dev, test).
@@ -62,9 +116,100 @@ def get_service(profile: str = None) -> TaskService:
     """
     if profile is None:
         profile = get_default_profile()
-    session = get_session(profile)
-    repository = SQLTaskRepository(session)
-    return TaskService(repository, session=session)
+
+    services = getattr(_thread_services, "services", None)
+    if services is None:
+        services = _thread_services.services = {}
+
+    service = services.get(profile)
+    if service is None:
+        _ensure_profile_initialized(profile)
+        session = Session(_get_profile_engine(profile))
+        repository = SQLTaskRepository(session)
+        service = services[profile] = TaskService(repository, session=session)
+    else:
+        service.session.close()
+
+    return service
+
+
+async def _run_with_service[T](profile: str | None, work: Callable[[TaskService], T]) -> T:
+    """Run blocking service work in a worker thread from an async tool.
+
+    The service is resolved inside the worker thread so its session belongs to
+    that thread, and the event loop stays free for other requests. ``work``
+    should return plain values (strings, ids), not ORM objects.
+
+    Args:
+        profile: Database profile to use (default, dev, test)
+        work: Callable receiving the TaskService for the profile
+
+    Returns:
+        Whatever ``work`` returns
+    """
+    return await asyncio.to_thread(lambda: work(get_service(profile)))
+
+
+# Columns read by the workspaces list; everything else stays deferred
+_WORKSPACE_LIST_COLUMNS = ("id", "title", "status", "workspace_path")
+
+# Enum lookups by value for form input (a dict miss replaces Enum() raising ValueError)
+_PRIORITY_BY_VALUE: dict[str, Priority] = {p.value: p for p in Priority}
+
+# MCP status vocabulary; accepts every TaskStatus value plus the todo/done aliases
+_MCP_STATUS_MAP: dict[str, TaskStatus] = {
+    # Standard workflow states
+    "todo": TaskStatus.PENDING,
+    "pending": TaskStatus.PENDING,  # Allow direct use too
+    "in_progress": TaskStatus.IN_PROGRESS,
+    "done": TaskStatus.COMPLETED,
+    "completed": TaskStatus.COMPLETED,  # Allow direct use too
+    "cancelled": TaskStatus.CANCELLED,
+    "archived": TaskStatus.ARCHIVED,
+    # Agent communication statuses
+    "assigned": TaskStatus.ASSIGNED,
+    "stuck": TaskStatus.STUCK,
+    "review": TaskStatus.REVIEW,
+    "integrate": TaskStatus.INTEGRATE,
+}
+
+_TASK_STATUS_TO_MCP: dict[TaskStatus, str] = {
+    # Standard workflow states
+    TaskStatus.PENDING: "todo",
+    TaskStatus.IN_PROGRESS: "in_progress",
+    TaskStatus.COMPLETED: "done",
+    TaskStatus.CANCELLED: "cancelled",
+    TaskStatus.ARCHIVED: "archived",
+    # Agent communication statuses
+    TaskStatus.ASSIGNED: "assigned",
+    TaskStatus.STUCK: "stuck",
+    TaskStatus.REVIEW: "review",
+    TaskStatus.INTEGRATE: "integrate",
+}
+
+# Display lookups shared by the task listings
+_STATUS_EMOJI: dict[TaskStatus, str] = {
+    TaskStatus.PENDING: "⭕",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.COMPLETED: "✅",
+    TaskStatus.CANCELLED: "❌",
+    TaskStatus.ARCHIVED: "📦",
+    TaskStatus.ASSIGNED: "⭐",
+    TaskStatus.STUCK: "⛔",
+    TaskStatus.REVIEW: "🔍",
+    TaskStatus.INTEGRATE: "✅",
+}
+_PRIORITY_EMOJI: dict[Priority, str] = {
+    Priority.HIGH: "🔴",
+    Priority.MEDIUM: "🟡",
+    Priority.LOW: "🟢",
+}
+
+# Statuses that are never reported as overdue
+_TERMINAL_STATUSES = TERMINAL_STATUSES
+
+# Statuses whose tasks count as past solutions for episodic memory
+_SOLVED_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.ARCHIVED})
 
 
 def mcp_status_to_task_status(mcp_status: str) -> TaskStatus:
@@ -92,27 +237,12 @@ def mcp_status_to_task_status(mcp_status: str) -> TaskStatus:
     Raises:
         ValueError: If status string is invalid
     """
-    status_map = {
-        # Standard workflow states
-        "todo": TaskStatus.PENDING,
-        "pending": TaskStatus.PENDING,  # Allow direct use too
-        "in_progress": TaskStatus.IN_PROGRESS,
-        "done": TaskStatus.COMPLETED,
-        "completed": TaskStatus.COMPLETED,  # Allow direct use too
-        "cancelled": TaskStatus.CANCELLED,
-        "archived": TaskStatus.ARCHIVED,
-        # Agent communication statuses
-        "assigned": TaskStatus.ASSIGNED,
-        "stuck": TaskStatus.STUCK,
-        "review": TaskStatus.REVIEW,
-        "integrate": TaskStatus.INTEGRATE,
-    }
-
-    if mcp_status not in status_map:
-        valid = ", ".join(sorted(status_map.keys()))
+    task_status = _MCP_STATUS_MAP.get(mcp_status)
+    if task_status is None:
+        valid = ", ".join(sorted(_MCP_STATUS_MAP))
         raise ValueError(f"Invalid status '{mcp_status}'. Valid values: {valid}")
 
-    return status_map[mcp_status]
+    return task_status
 
 
 def task_status_to_mcp_status(task_status: TaskStatus) -> str:
@@ -137,24 +267,16 @@ def task_status_to_mcp_status(task_status: TaskStatus) -> str:
     Returns:
         str: MCP-friendly status string
     """
-    reverse_map = {
-        # Standard workflow states
-        TaskStatus.PENDING: "todo",
-        TaskStatus.IN_PROGRESS: "in_progress",
-        TaskStatus.COMPLETED: "done",
-        TaskStatus.CANCELLED: "cancelled",
-        TaskStatus.ARCHIVED: "archived",
-        # Agent communication statuses
-        TaskStatus.ASSIGNED: "assigned",
-        TaskStatus.STUCK: "stuck",
-        TaskStatus.REVIEW: "review",
-        TaskStatus.INTEGRATE: "integrate",
-    }
-    return reverse_map[task_status]
+    return _TASK_STATUS_TO_MCP[task_status]
 
 
-def format_task_markdown(task: Task) -> str:
-    """Format a task as Markdown."""
+def format_task_markdown(task: Task, today: date | None = None) -> str:
+    """Format a task as Markdown.
+
+    Args:
+        task: Task to format
+        today: Reference date for the overdue flag (defaults to today)
+    """
     lines = [
         f"# Task #{task.id}: {task.title}",
         "",
@@ -166,9 +288,6 @@ def format_task_markdown(task: Task) -> str:
         lines.extend(["", f"**Description:** {task.description}"])
 
     if task.jira_issues:
-        from taskmanager.config import get_settings
-        from taskmanager.service import TaskService
-
         settings = get_settings()
         jira_url = settings.atlassian.jira_url if settings.atlassian else None
         jira_links = TaskService.format_jira_links(task.jira_issues, jira_url)
@@ -185,11 +304,9 @@ def format_task_markdown(task: Task) -> str:
         lines.append(f"**Tags:** {task.tags}")
 
     if task.due_date:
-        is_overdue = task.due_date < date.today() and task.status not in [
-            TaskStatus.COMPLETED,
-            TaskStatus.CANCELLED,
-            TaskStatus.ARCHIVED,
-        ]
+        is_overdue = task.due_date < (today or date.today()) and (
+            task.status not in _TERMINAL_STATUSES
+        )
         due_str = f"{task.due_date} ⚠️ OVERDUE" if is_overdue else str(task.due_date)
         lines.append(f"**Due:** {due_str}")
 
@@ -216,6 +333,106 @@ def format_task_markdown(task: Task) -> str:
     return "\n".join(lines)
 
 
+def format_task_row(task: Task | TaskSummary, today: date) -> str:
+    """Format a task as a single Markdown list line.
+
+    Args:
+        task: Task or summary row to format (reads id, title, status, priority, due_date)
+        today: Reference date for the overdue flag
+
+    Returns:
+        str: One line with status/priority emoji, id, title and due date
+    """
+    status_emoji = _STATUS_EMOJI.get(task.status, "❓")
+    priority_emoji = _PRIORITY_EMOJI.get(task.priority, "⚪")
+
+    # Read the instrumented ORM attribute once
+    due_date = task.due_date
+    due_info = ""
+    if due_date:
+        is_overdue = due_date < today and task.status not in _TERMINAL_STATUSES
+        due_info = f" | Due: {due_date}{' ⚠️ OVERDUE' if is_overdue else ''}"
+
+    return f"{status_emoji} {priority_emoji} **#{task.id}** {task.title}{due_info}"
+
+
+def _nonempty(value: str | None) -> str | None:
+    """Strip a form field, treating blank input as not provided.
+
+    Args:
+        value: Raw form field value
+
+    Returns:
+        str | None: Stripped value, or None if empty or whitespace only
+    """
+    if not value:
+        return None
+    return value.strip() or None
+
+
+def _pack_updates(
+    title: str | None = None,
+    description: str | None = None,
+    priority: str | None = None,
+    status: str | None = None,
+    due_date: str | None = None,
+    jira_issues: str | None = None,
+    tags: str | None = None,
+    *,
+    strip_strings: bool = False,
+) -> tuple[dict, str | None]:
+    """Validate raw update values and pack them into TaskService.update_task kwargs.
+
+    Shared by update_task and update_task_interactive. Fields left as None are
+    not updated.
+
+    Args:
+        title: New title
+        description: New description
+        priority: Priority value (low, medium, high, urgent)
+        status: MCP status string (see mcp_status_to_task_status)
+        due_date: Due date in YYYY-MM-DD format
+        jira_issues: Comma-separated JIRA issue keys
+        tags: Comma-separated tags
+        strip_strings: Strip every value and skip blank ones (form input)
+
+    Returns:
+        tuple: (update kwargs, error message or None if all values are valid)
+    """
+    fields = {
+        "title": title,
+        "description": description,
+        "priority": priority,
+        "status": status,
+        "due_date": due_date,
+        "jira_issues": jira_issues,
+        "tags": tags,
+    }
+
+    updates: dict = {}
+    for field, raw in fields.items():
+        value = _nonempty(raw) if strip_strings else raw
+        if value is None:
+            continue
+        if field == "priority":
+            value = _PRIORITY_BY_VALUE.get(value)
+            if value is None:
+                return {}, f"❌ Invalid priority: {raw}. Use: low, medium, high, urgent"
+        elif field == "status":
+            value = _MCP_STATUS_MAP.get(value)
+            if value is None:
+                valid = ", ".join(_MCP_STATUS_MAP)
+                return {}, f"❌ Invalid status: {raw}. Use: {valid}"
+        elif field == "due_date":
+            try:
+                value = TaskService.parse_due_date(value)
+            except ValueError:
+                return {}, f"❌ Invalid date format: {raw}. Use YYYY-MM-DD"
+        updates[field] = value
+
+    return updates, None
+
+
 # ============================================================================
 # User Elicitation Forms (Pydantic Models)
 # ============================================================================
@@ -305,24 +522,25 @@ async def create_task_interactive(
 
         # Parse due_date if provided
         parsed_due_date = None
-        if task_data.due_date and task_data.due_date.strip():
+        if (due_date := _nonempty(task_data.due_date)) is not None:
             try:
-                parsed_due_date = datetime.strptime(task_data.due_date.strip(), "%Y-%m-%d").date()
+                parsed_due_date = TaskService.parse_due_date(due_date)
             except ValueError:
                 return f"❌ Invalid date format: {task_data.due_date}. Use YYYY-MM-DD"
 
         # Create task in database
-        service = get_service(profile)
-        task = service.create_task(
-            title=task_data.title,
-            description=task_data.description if task_data.description.strip() else None,
-            priority=Priority(task_data.priority),
-            due_date=parsed_due_date,
-            jira_issues=task_data.jira_issues if task_data.jira_issues.strip() else None,
-            tags=task_data.tags if task_data.tags.strip() else None,
-        )
+        def create(service: TaskService) -> str:
+            task = service.create_task(
+                title=task_data.title,
+                description=_nonempty(task_data.description),
+                priority=_PRIORITY_BY_VALUE[task_data.priority],
+                due_date=parsed_due_date,
+                jira_issues=_nonempty(task_data.jira_issues),
+                tags=_nonempty(task_data.tags),
+            )
+            return f"✅ **Created task #{task.id}:** {task.title}\n\n{format_task_markdown(task)}"
 
-        return f"✅ **Created task #{task.id}:** {task.title}\n\n{format_task_markdown(task)}"
+        return await _run_with_service(profile, create)
 
     elif result.action == "decline":
         return "❌ Task creation declined - no changes made"
@@ -346,16 +564,12 @@ async def update_task_interactive(
         task_id: The ID of the task to update
         profile: Database profile to use (default, dev, test)
     """
-    service = get_service(profile)
-
     # Fetch current task
-    task = service.get_task(task_id)
-    if not task:
-        return f"❌ Task #{task_id} not found"
+    title = await _run_with_service(profile, lambda service: service.get_task(task_id).title)
 
     # Request updates with current values shown
     result = await ctx.elicit(
-        message=f"Update task #{task_id}: {task.title}\n\nCurrent values will be shown in the form. Leave fields empty to keep current values.",
+        message=f"Update task #{task_id}: {title}\n\nCurrent values will be shown in the form. Leave fields empty to keep current values.",
         response_type=TaskUpdateForm,
     )
 
@@ -363,41 +577,30 @@ async def update_task_interactive(
         updates = result.data
 
         # Build update dict with only changed fields (non-empty strings)
-        update_dict = {}
-        if updates.title and updates.title.strip():
-            update_dict["title"] = updates.title.strip()
-        if updates.description and updates.description.strip():
-            update_dict["description"] = updates.description.strip()
-        if updates.priority and updates.priority.strip():
-            try:
-                update_dict["priority"] = Priority(updates.priority.strip())
-            except ValueError:
-                return f"❌ Invalid priority: {updates.priority}. Use: low, medium, high"
-        if updates.status and updates.status.strip():
-            try:
-                update_dict["status"] = TaskStatus(updates.status.strip())
-            except ValueError:
-                return f"❌ Invalid status: {updates.status}. Use: pending, in_progress, completed, cancelled, archived, assigned, stuck, review, integrate"
-        if updates.due_date and updates.due_date.strip():
-            try:
-                update_dict["due_date"] = datetime.strptime(
-                    updates.due_date.strip(), "%Y-%m-%d"
-                ).date()
-            except ValueError:
-                return f"❌ Invalid date format: {updates.due_date}. Use YYYY-MM-DD"
-        if updates.jira_issues and updates.jira_issues.strip():
-            update_dict["jira_issues"] = updates.jira_issues.strip()
-        if updates.tags and updates.tags.strip():
-            update_dict["tags"] = updates.tags.strip()
+        update_dict, error = _pack_updates(
+            title=updates.title,
+            description=updates.description,
+            priority=updates.priority,
+            status=updates.status,
+            due_date=updates.due_date,
+            jira_issues=updates.jira_issues,
+            tags=updates.tags,
+            strip_strings=True,
+        )
+        if error:
+            return error
 
         if not update_dict:
             return "ℹ️ No changes made - all fields were empty"
 
         # Update the task
-        updated_task = service.update_task(task_id, **update_dict)
+        changed_fields = ", ".join(update_dict)
+
+        def update(service: TaskService) -> str:
+            updated_task = service.update_task(task_id, **update_dict)
+            return f"✅ **Updated task #{task_id}:** {changed_fields}\n\n{format_task_markdown(updated_task)}"
 
-        changed_fields = ", ".join(update_dict.keys())
-        return f"✅ **Updated task #{task_id}:** {changed_fields}\n\n{format_task_markdown(updated_task)}"
+        return await _run_with_service(profile, update)
 
     elif result.action == "decline":
         return "❌ Update declined - no changes made"
@@ -421,23 +624,23 @@ async def delete_task_interactive(
         task_id: The ID of the task to delete
         profile: Database profile to use (default, dev, test)
     """
-    service = get_service(profile)
-
     # Fetch task to show details
-    task = service.get_task(task_id)
-    if not task:
-        return f"❌ Task #{task_id} not found"
+    def fetch(service: TaskService) -> tuple[str, str]:
+        task = service.get_task(task_id)
+        return task.title, format_task_markdown(task)
+
+    title, task_markdown = await _run_with_service(profile, fetch)
 
     # Request confirmation
     result = await ctx.elicit(
-        message=f"⚠️ **Confirm Deletion**\n\n{format_task_markdown(task)}\n\nThis action cannot be undone.",
+        message=f"⚠️ **Confirm Deletion**\n\n{task_markdown}\n\nThis action cannot be undone.",
         response_type=TaskDeletionConfirmation,
     )
 
     if result.action == "accept" and result.data.confirm:
         # Delete the task
-        service.delete_task(task_id)
-        return f"✅ Deleted task #{task_id}: {task.title}"
+        await _run_with_service(profile, lambda service: service.delete_task(task_id))
+        return f"✅ Deleted task #{task_id}: {title}"
 
     elif result.action == "decline" or not result.data.confirm:
         return "❌ Deletion declined - task preserved"
@@ -493,7 +696,7 @@ def create_task(
     parsed_due_date = None
     if due_date:
         try:
-            parsed_due_date = datetime.strptime(due_date, "%Y-%m-%d").date()
+            parsed_due_date = TaskService.parse_due_date(due_date)
         except ValueError:
             return f"❌ Invalid date format: {due_date}. Use YYYY-MM-DD"
 
@@ -506,7 +709,7 @@ def create_task(
     task = service.create_task(
         title=title,
         description=description,
-        priority=Priority(priority),
+        priority=_PRIORITY_BY_VALUE[priority],
         status=mcp_status_to_task_status(status),
         due_date=parsed_due_date,
         tags=tags_str,
@@ -533,15 +736,19 @@ def list_tasks(
     priority: Literal["low", "medium", "high", "urgent", "all"] = "all",
     tag: str | None = None,
     overdue_only: bool = False,
+    limit: int = 50,
+    offset: int = 0,
     profile: Literal["default", "dev", "test"] = None,
 ) -> str:
-    """List tasks with optional filtering.
+    """List tasks with optional filtering and pagination.
 
     Args:
         status: Filter by status (todo, in_progress, done, cancelled, archived, assigned, stuck, review, integrate, all)
         priority: Filter by priority (low, medium, high, urgent, all)
         tag: Filter by tag
         overdue_only: Show only overdue tasks
+        limit: Maximum number of tasks to return (1-100, default: 50)
+        offset: Number of tasks to skip, for fetching the next page (default: 0)
         profile: Database profile to use (default, dev, test)
     """
     try:
@@ -552,59 +759,38 @@ def list_tasks(
         if status != "all":
             filters["status"] = mcp_status_to_task_status(status)
         if priority != "all":
-            filters["priority"] = Priority(priority)
+            filters["priority"] = _PRIORITY_BY_VALUE[priority]
         if tag:
             filters["tag"] = tag
 
+        # One reference date for both the SQL overdue filter and the OVERDUE flags
+        today = date.today()
+
         # Get tasks (service returns tuple of tasks and total count)
-        tasks, total = service.list_tasks(**filters)
-
-        # Filter overdue if requested
-        if overdue_only:
-            today = date.today()
-            tasks = [
-                t
-                for t in tasks
-                if t.due_date
-                and t.due_date < today
-                and t.status not in [TaskStatus.COMPLETED, TaskStatus.ARCHIVED]
-            ]
+        tasks, total = service.list_task_summaries(
+            **filters,
+            limit=limit,
+            offset=offset,
+            overdue_only=overdue_only,
+            today=today,
+        )
 
         if not tasks:
+            if total:
+                return f"📭 No tasks at offset {offset} - {total} task(s) match the criteria"
             return "📭 No tasks found matching the criteria"
 
         # Format output
-        lines = [f"📋 **Found {len(tasks)} task(s)**\n"]
-
-        for task in tasks:
-            status_emoji = {
-                TaskStatus.PENDING: "⭕",
-                TaskStatus.IN_PROGRESS: "🔄",
-                TaskStatus.COMPLETED: "✅",
-                TaskStatus.CANCELLED: "❌",
-                TaskStatus.ARCHIVED: "📦",
-                TaskStatus.ASSIGNED: "⭐",
-                TaskStatus.STUCK: "⛔",
-                TaskStatus.REVIEW: "🔍",
-                TaskStatus.INTEGRATE: "✅",
-            }.get(task.status, "❓")
-
-            priority_emoji = {
-                Priority.HIGH: "🔴",
-                Priority.MEDIUM: "🟡",
-                Priority.LOW: "🟢",
-            }.get(task.priority, "⚪")
-
-            due_info = ""
-            if task.due_date:
-                is_overdue = task.due_date < date.today() and task.status not in [
-                    TaskStatus.COMPLETED,
-                    TaskStatus.CANCELLED,
-                    TaskStatus.ARCHIVED,
-                ]
-                due_info = f" | Due: {task.due_date}" + (" ⚠️ OVERDUE" if is_overdue else "")
-
-            lines.append(f"{status_emoji} {priority_emoji} **#{task.id}** {task.title}{due_info}")
+        lines = [f"📋 **Found {total} task(s)**\n"]
+
+        lines.extend(format_task_row(task, today) for task in tasks)
+
+        shown_end = offset + len(tasks)
+        if offset > 0 or shown_end < total:
+            footer = f"\n📄 Showing {offset + 1}-{shown_end} of {total}"
+            if shown_end < total:
+                footer += f" — pass offset={shown_end} for the next page"
+            lines.append(footer)
 
         return "\n".join(lines)
     except ValueError as e:
@@ -676,27 +862,17 @@ def update_task(
     try:
         service = get_service(profile)
 
-        # Build update dict
-        updates = {}
-        if title is not None:
-            updates["title"] = title
-        if description is not None:
-            updates["description"] = description
-        if priority is not None:
-            updates["priority"] = Priority(priority)
-        if status is not None:
-            updates["status"] = mcp_status_to_task_status(status)
-        if tags is not None:
-            updates["tags"] = ",".join(tags) if tags else ""
-        if jira_issues is not None:
-            updates["jira_issues"] = jira_issues
-
-        # Parse due_date if provided
-        if due_date is not None:
-            try:
-                updates["due_date"] = datetime.strptime(due_date, "%Y-%m-%d").date()
-            except ValueError:
-                return f"❌ Invalid date format: {due_date}. Use YYYY-MM-DD"
+        updates, error = _pack_updates(
+            title=title,
+            description=description,
+            priority=priority,
+            status=status,
+            due_date=due_date,
+            jira_issues=jira_issues,
+            tags=",".join(tags) if tags is not None else None,
+        )
+        if error:
+            return error
 
         if not updates:
             return "ℹ️ No updates provided - task unchanged"
@@ -704,7 +880,7 @@ def update_task(
         # Update the task
         task = service.update_task(task_id, **updates)
 
-        changed_fields = ", ".join(updates.keys())
+        changed_fields = ", ".join(updates)
         return f"✅ **Updated task #{task_id}:** {changed_fields}\n\n{format_task_markdown(task)}"
     except ValueError as e:
         return f"❌ Error: {str(e)}"
@@ -749,9 +925,7 @@ def delete_task(
     """
     try:
         service = get_service(profile)
-        task = service.get_task(task_id)
-        title = task.title
-        service.delete_task(task_id)
+        title = service.delete_task_returning_title(task_id)
         return f"✅ Deleted task #{task_id}: {title}"
     except ValueError as e:
         return f"❌ Error: {str(e)}"
@@ -1000,13 +1174,9 @@ def ensure_workspace(
     try:
         service = get_service(profile)
 
-        # Check if workspace already exists
-        existing_path = service.get_workspace_path(task_id)
-        if existing_path:
-            return f"✓ Workspace already exists for task #{task_id}\n\n📁 Path: `{existing_path}`"
-
-        # Create new workspace
-        metadata = service.create_workspace(task_id=task_id, initialize_git=initialize_git)
+        path, metadata = service.ensure_workspace(task_id, initialize_git=initialize_git)
+        if metadata is None:
+            return f"✓ Workspace already exists for task #{task_id}\n\n📁 Path: `{path}`"
 
         git_status = "✓ Git initialized" if metadata["git_initialized"] else "✗ Git not initialized"
 
@@ -1042,14 +1212,10 @@ def delete_workspace(
     try:
         service = get_service(profile)
 
-        # Check if workspace exists
-        path = service.get_workspace_path(task_id)
+        path, deleted = service.delete_workspace_if_exists(task_id)
         if not path:
             return f"ℹ️ No workspace exists for task #{task_id}"
 
-        # Delete workspace
-        deleted = service.delete_workspace(task_id)
-
         if deleted:
             return f"✅ Deleted workspace for task #{task_id}\n\nPath: `{path}` (removed)"
         else:
@@ -1060,6 +1226,113 @@ def delete_workspace(
         return f"❌ Unexpected error: {str(e)}"
 
 
+# Matching lines longer than this are cut (minified files would otherwise flood the reply)
+_MAX_MATCH_LINE_CHARS = 500
+
+
+def _rg_text(field: dict) -> str:
+    """Decode a ripgrep JSON text field (non-UTF-8 data arrives base64-encoded)."""
+    if "text" in field:
+        return field["text"]
+    return base64.b64decode(field["bytes"]).decode("utf-8", errors="replace")
+
+
+def _format_rg_json(
+    events: Iterable[str | bytes], max_matches: int | None = None
+) -> tuple[int, int, str]:
+    """Turn ``rg --json`` output into counts and heading-style match lines.
+
+    Args:
+        events: Line-delimited JSON events printed by ripgrep (any iterable of
+            lines, so a pipe can be consumed while ripgrep is still running;
+            raw bytes lines are parsed without a separate decode step)
+        max_matches: Stop reading once this many matching lines are collected
+            (optional, reads everything when omitted)
+
+    Returns:
+        tuple: (files with matches, matching lines, text with one heading per
+        file followed by ``line_number:text`` lines)
+    """
+    file_count = 0
+    match_count = 0
+    lines: list[str] = []
+    for raw in events:
+        event = json.loads(raw)
+        kind = event["type"]
+        # ripgrep only sends "begin" for files that have matches
+        if kind == "begin":
+            file_count += 1
+            if lines:
+                lines.append("")
+            lines.append(_rg_text(event["data"]["path"]))
+        elif kind == "match":
+            data = event["data"]
+            match_count += 1
+            text = _rg_text(data["lines"]).rstrip("\r\n")
+            if len(text) > _MAX_MATCH_LINE_CHARS:
+                text = f"{text[:_MAX_MATCH_LINE_CHARS]} [... line truncated]"
+            lines.append(f"{data['line_number']}:{text}")
+            if match_count == max_matches:
+                break
+    return file_count, match_count, "\n".join(lines)
+
+
+def _run_rg_json(
+    rg_args: list[str], max_matches: int, timeout: float = 10
+) -> tuple[int, int, str]:
+    """Run ``rg --json`` and format its events as they stream in.
+
+    Output is parsed line by line instead of being buffered whole, and ripgrep
+    is stopped as soon as max_matches matching lines have been read.
+
+    Args:
+        rg_args: Full ripgrep command line (must include ``--json``)
+        max_matches: Maximum number of matching lines to collect
+        timeout: Seconds to let ripgrep run before killing it (default: 10)
+
+    Returns:
+        tuple: Same as _format_rg_json
+
+    Raises:
+        subprocess.TimeoutExpired: If ripgrep ran longer than timeout
+        subprocess.CalledProcessError: If ripgrep exited with an error
+        FileNotFoundError: If ripgrep is not installed
+    """
+    # stderr goes to a temp file: nothing reads it while stdout streams, and a
+    # full stderr pipe (many per-file errors) would block ripgrep's stdout too
+    with tempfile.TemporaryFile() as stderr_file:
+        # Binary pipe: json.loads parses the UTF-8 event lines directly, so no
+        # TextIOWrapper decodes and newline-translates the stream first
+        proc = subprocess.Popen(
+            rg_args, stdout=subprocess.PIPE, stderr=stderr_file, bufsize=1 << 16
+        )
+        timed_out = threading.Event()
+
+        def _kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill_on_timeout)
+        timer.start()
+        try:
+            result = _format_rg_json(proc.stdout, max_matches)
+        finally:
+            timer.cancel()
+            # Stopped early (limit reached or parse error): don't wait for the rest
+            if proc.poll() is None:
+                proc.kill()
+            proc.communicate()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(rg_args, timeout)
+        if proc.returncode > 1:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(
+                proc.returncode, rg_args, stderr=stderr_file.read().decode("utf-8", "replace")
+            )
+    return result
+
+
 @mcp.tool()
 def search_workspace(
     task_id: int,
@@ -1080,9 +1353,9 @@ def search_workspace(
         file_pattern: File pattern to search (e.g., "*.py", "*.md", "notes/*")
         case_sensitive: Whether to match case exactly (default: False)
         max_results: Maximum number of results to return (default: 50)
-    """
-    import subprocess
 
+    Files over 10 MB are skipped, and matching lines are cut at 500 characters.
+    """
     try:
         service = get_service(profile)
 
@@ -1094,16 +1367,8 @@ def search_workspace(
         if not workspace_path.exists():
             return f"❌ Workspace directory not found: {workspace_path}"
 
-        # Build ripgrep command
-        rg_args = [
-            "rg",
-            "--color",
-            "never",
-            "--line-number",
-            "--heading",
-            "--max-count",
-            str(max_results),
-        ]
+        # Build ripgrep command (JSON events give exact file/match counts)
+        rg_args = ["rg", "--json", *RG_BASE_ARGS, "--max-count", str(max_results)]
 
         if not case_sensitive:
             rg_args.append("--ignore-case")
@@ -1113,44 +1378,20 @@ def search_workspace(
             rg_args.extend(["--glob", file_pattern])
 
         # Exclude git and tmp directories
-        rg_args.extend(
-            [
-                "--glob",
-                "!.git",
-                "--glob",
-                "!tmp/*",
-                "--glob",
-                "!*.pyc",
-                "--glob",
-                "!__pycache__",
-            ]
-        )
+        rg_args.extend(RG_EXCLUDE_ARGS)
 
-        rg_args.extend([query, str(workspace_path)])
+        rg_args.extend(["--", query, str(workspace_path)])
 
-        # Execute search
-        result = subprocess.run(rg_args, capture_output=True, text=True, timeout=10)
+        # Execute search, stopping ripgrep once max_results lines are in
+        try:
+            file_count, match_count, matches_text = _run_rg_json(rg_args, max_results)
+        except subprocess.CalledProcessError as e:
+            return f"❌ Search error: {e.stderr}"
 
         # Handle no results
-        if result.returncode == 1:
-            return f"🔍 No matches found in workspace for task #{task_id}\n\n**Query:** `{query}`\n**Pattern:** `{file_pattern}`"
-
-        # Handle errors
-        if result.returncode > 1:
-            return f"❌ Search error: {result.stderr}"
-
-        # Format results
-        output_lines = result.stdout.strip().split("\n")
-
-        if not output_lines or output_lines[0] == "":
+        if match_count == 0:
             return f"🔍 No matches found in workspace for task #{task_id}\n\n**Query:** `{query}`\n**Pattern:** `{file_pattern}`"
 
-        # Count matches and files
-        file_count = len(
-            [line for line in output_lines if line and not line.startswith(" ") and ":" in line]
-        )
-        match_count = len([line for line in output_lines if line.startswith(" ")])
-
         result_text = f"""🔍 **Search Results for Task #{task_id}**
 
 **Query:** `{query}`
@@ -1159,7 +1400,7 @@ def search_workspace(
 
 ---
 
-{result.stdout.strip()}
+{matches_text}
 
 ---
 
@@ -1177,6 +1418,62 @@ def search_workspace(
         return f"❌ Unexpected error: {str(e)}"
 
 
+def _search_result_lines(
+    query: str,
+    total: int,
+    task_matches: list[tuple[Task, list[str]]],
+    workspace_matches: list[dict],
+) -> Iterator[str]:
+    """Yield the lines of a search_all_tasks report (first 20 matches of each kind).
+
+    Args:
+        query: The search text
+        total: Number of tasks searched
+        task_matches: (task, matched field labels) pairs
+        workspace_matches: {"task", "files"} dicts for workspaces with matching files
+
+    Yields:
+        str: Report lines, to be joined with newlines
+    """
+    yield f"🔍 **Search Results for:** `{query}`"
+    yield ""
+    yield f"**Searched:** {total} task(s)"
+    yield f"**Found:** {len(task_matches)} task metadata match(es), {len(workspace_matches)} workspace match(es)"
+    yield ""
+
+    # Show task metadata matches
+    if task_matches:
+        yield "## 📋 Task Metadata Matches"
+        yield ""
+
+        for task, fields in task_matches[:20]:
+            yield f"{_STATUS_EMOJI.get(task.status, '❓')} **Task #{task.id}**: {task.title}"
+            yield f"   Matched in: {', '.join(fields)}"
+            if task.workspace_path:
+                yield "   📁 Has workspace"
+            yield ""
+
+    # Show workspace matches
+    if workspace_matches:
+        yield "## 📂 Workspace Content Matches"
+        yield ""
+
+        for match in workspace_matches[:20]:
+            task = match["task"]
+            files = match["files"]
+
+            yield f"{_STATUS_EMOJI.get(task.status, '❓')} **Task #{task.id}**: {task.title}"
+            yield f"   📄 Found in {len(files)} file(s):"
+            yield from (f"      - `{f}`" for f in files[:5])
+            if len(files) > 5:
+                yield f"      ... and {len(files) - 5} more"
+            yield ""
+
+    yield "---"
+    yield "💡 Use `get_task(task_id)` to view task details"
+    yield f"💡 Use `search_workspace(task_id, '{query}')` to see specific matches"
+
+
 @mcp.tool()
 def search_all_tasks(
     query: str,
@@ -1205,7 +1502,7 @@ def search_all_tasks(
     - Workspace content (notes, code, logs) if workspaces exist
 
     This is useful when you don't know which task contains the information
-    you're looking for.
+    you're looking for. Workspace files over 10 MB are skipped.
 
     Args:
         query: Text to search for
@@ -1215,8 +1512,6 @@ def search_all_tasks(
         case_sensitive: Whether to match case exactly (default: False)
         status_filter: Filter by task status (todo, in_progress, done, cancelled, archived, assigned, stuck, review, integrate, all)
     """
-    import subprocess
-
     try:
         service = get_service(profile)
 
@@ -1225,8 +1520,13 @@ def search_all_tasks(
         if status_filter != "all":
             filters["status"] = mcp_status_to_task_status(status_filter)
 
-        # Get all tasks
-        tasks, total = service.list_tasks(**filters, limit=100)
+        # Only the workspace scan needs task rows (the most recent 100); a
+        # metadata-only search just reports how many tasks it covered
+        if search_workspaces:
+            tasks, total = service.list_tasks(**filters, limit=100, columns=_WORKSPACE_LIST_COLUMNS)
+        else:
+            tasks = []
+            total = service.count_tasks(**filters)
 
         if total == 0:
             return "📭 No tasks found"
@@ -1236,95 +1536,28 @@ def search_all_tasks(
 
         # Search task metadata
         if search_task_fields:
-            query_lower = query.lower() if not case_sensitive else query
-
-            for task in tasks:
-                matches = []
-
-                # Check title
-                title_check = task.title.lower() if not case_sensitive else task.title
-                if query_lower in title_check:
-                    matches.append("title")
-
-                # Check description
-                if task.description:
-                    desc_check = (
-                        task.description.lower() if not case_sensitive else task.description
-                    )
-                    if query_lower in desc_check:
-                        matches.append("description")
-
-                # Check tags
-                if task.tags:
-                    tags_check = task.tags.lower() if not case_sensitive else task.tags
-                    if query_lower in tags_check:
-                        matches.append("tags")
-
-                # Check JIRA issues
-                if task.jira_issues:
-                    jira_check = (
-                        task.jira_issues.lower() if not case_sensitive else task.jira_issues
-                    )
-                    if query_lower in jira_check:
-                        matches.append("JIRA")
+            task_matches = service.search_tasks(query, case_sensitive=case_sensitive, **filters)
 
-                if matches:
-                    task_matches.append({"task": task, "fields": matches})
-
-        # Search workspaces
+        # Search workspaces (a single ripgrep run covers every workspace)
         if search_workspaces:
-            for task in tasks:
-                if not task.workspace_path or not task.id:
-                    continue
-
-                workspace_path = service.get_workspace_path(task.id)
-                if not workspace_path or not workspace_path.exists():
-                    continue
-
-                try:
-                    # Build ripgrep command
-                    rg_args = [
-                        "rg",
-                        "--color",
-                        "never",
-                        "--files-with-matches",
-                        "--max-count",
-                        "5",
-                    ]
-
-                    if not case_sensitive:
-                        rg_args.append("--ignore-case")
-
-                    if file_pattern != "*":
-                        rg_args.extend(["--glob", file_pattern])
-
-                    rg_args.extend(
-                        [
-                            "--glob",
-                            "!.git",
-                            "--glob",
-                            "!tmp/*",
-                            "--glob",
-                            "!*.pyc",
-                            "--glob",
-                            "!__pycache__",
-                        ]
-                    )
-
-                    rg_args.extend([query, str(workspace_path)])
-
-                    result = subprocess.run(rg_args, capture_output=True, text=True, timeout=5)
-
-                    if result.returncode == 0:
-                        matched_files = result.stdout.strip().split("\n")
-                        matched_files = [
-                            f.replace(str(workspace_path) + "/", "") for f in matched_files if f
-                        ]
-
-                        workspace_matches.append({"task": task, "files": matched_files})
+            workspace_tasks = {
+                Path(task.workspace_path): task for task in tasks if task.workspace_path
+            }
+            try:
+                files_by_workspace = find_files_with_matches(
+                    list(workspace_tasks),
+                    query,
+                    file_pattern=file_pattern,
+                    case_sensitive=case_sensitive,
+                )
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                files_by_workspace = {}
 
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    continue
+            workspace_matches = [
+                {"task": task, "files": files_by_workspace[path]}
+                for path, task in workspace_tasks.items()
+                if path in files_by_workspace
+            ]
 
         # Format results
         if not task_matches and not workspace_matches:
@@ -1335,77 +1568,7 @@ def search_all_tasks(
 **Workspaces:** {"Yes" if search_workspaces else "No"}
 **Task Fields:** {"Yes" if search_task_fields else "No"}"""
 
-        lines = [
-            f"🔍 **Search Results for:** `{query}`",
-            "",
-            f"**Searched:** {total} task(s)",
-            f"**Found:** {len(task_matches)} task metadata match(es), {len(workspace_matches)} workspace match(es)",
-            "",
-        ]
-
-        # Show task metadata matches
-        if task_matches:
-            lines.extend(["## 📋 Task Metadata Matches", ""])
-
-            for match in task_matches[:20]:
-                task = match["task"]
-                fields = ", ".join(match["fields"])
-
-                status_emoji = {
-                    TaskStatus.PENDING: "⭕",
-                    TaskStatus.IN_PROGRESS: "🔄",
-                    TaskStatus.COMPLETED: "✅",
-                    TaskStatus.CANCELLED: "❌",
-                    TaskStatus.ARCHIVED: "📦",
-                    TaskStatus.ASSIGNED: "⭐",
-                    TaskStatus.STUCK: "⛔",
-                    TaskStatus.REVIEW: "🔍",
-                    TaskStatus.INTEGRATE: "✅",
-                }.get(task.status, "❓")
-
-                lines.append(f"{status_emoji} **Task #{task.id}**: {task.title}")
-                lines.append(f"   Matched in: {fields}")
-                if task.workspace_path:
-                    lines.append("   📁 Has workspace")
-                lines.append("")
-
-        # Show workspace matches
-        if workspace_matches:
-            lines.extend(["## 📂 Workspace Content Matches", ""])
-
-            for match in workspace_matches[:20]:
-                task = match["task"]
-                files = match["files"]
-
-                status_emoji = {
-                    TaskStatus.PENDING: "⭕",
-                    TaskStatus.IN_PROGRESS: "🔄",
-                    TaskStatus.COMPLETED: "✅",
-                    TaskStatus.CANCELLED: "❌",
-                    TaskStatus.ARCHIVED: "📦",
-                    TaskStatus.ASSIGNED: "⭐",
-                    TaskStatus.STUCK: "⛔",
-                    TaskStatus.REVIEW: "🔍",
-                    TaskStatus.INTEGRATE: "✅",
-                }.get(task.status, "❓")
-
-                lines.append(f"{status_emoji} **Task #{task.id}**: {task.title}")
-                lines.append(f"   📄 Found in {len(files)} file(s):")
-                for f in files[:5]:
-                    lines.append(f"      - `{f}`")
-                if len(files) > 5:
-                    lines.append(f"      ... and {len(files) - 5} more")
-                lines.append("")
-
-        lines.extend(
-            [
-                "---",
-                "💡 Use `get_task(task_id)` to view task details",
-                f"💡 Use `search_workspace(task_id, '{query}')` to see specific matches",
-            ]
-        )
-
-        return "\n".join(lines)
+        return "\n".join(_search_result_lines(query, total, task_matches, workspace_matches))
 
     except FileNotFoundError:
         return "❌ Search tool 'ripgrep' not found. Install with: brew install ripgrep"
@@ -1420,6 +1583,7 @@ def list_workspace_files(
     task_id: int,
     subdirectory: str = "",
     file_pattern: str = "*",
+    recursive: bool = True,
     profile: Literal["default", "dev", "test"] = None,
 ) -> str:
     """List files in a task's workspace.
@@ -1430,6 +1594,8 @@ def list_workspace_files(
         task_id: The ID of the task
         subdirectory: Subdirectory to list (e.g., "notes", "code", "logs")
         file_pattern: Pattern to filter files (e.g., "*.py", "*.md")
+        recursive: Include files in nested directories (default: True); set False
+            to list only the top level of the directory
     """
     import datetime
 
@@ -1447,24 +1613,12 @@ def list_workspace_files(
         if not target_path.exists():
             return f"❌ Directory not found: {target_path}"
 
-        # Get matching files
-        if file_pattern == "*":
-            files = list(target_path.rglob("*"))
-        else:
-            files = list(target_path.rglob(file_pattern))
-
-        # Filter to only files (not directories)
-        files = [f for f in files if f.is_file()]
-
-        # Exclude git and cache files
-        files = [f for f in files if ".git" not in str(f) and "__pycache__" not in str(f)]
+        # Matching files, most recently modified first
+        files = scan_workspace_files(target_path, file_pattern, recursive=recursive)
 
         if not files:
             return f"📂 No files found in workspace\n\n**Path:** `{target_path}`\n**Pattern:** `{file_pattern}`"
 
-        # Sort by modification time (most recent first)
-        files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
         # Format results
         lines = [
             f"📂 **Workspace Files for Task #{task_id}**",
@@ -1477,10 +1631,9 @@ def list_workspace_files(
             "",
         ]
 
-        for f in files[:50]:  # Limit to 50 files
-            relative_path = f.relative_to(workspace_path)
-            size = f.stat().st_size
-            modified = datetime.datetime.fromtimestamp(f.stat().st_mtime)
+        for path, size, mtime in files[:50]:  # Limit to 50 files
+            relative_path = Path(path).relative_to(workspace_path)
+            modified = datetime.datetime.fromtimestamp(mtime)
 
             # Format size
             if size < 1024:
@@ -1683,7 +1836,7 @@ def list_workspaces() -> str:
     service = get_service()
 
     # Get all tasks with workspaces
-    all_tasks, _ = service.list_tasks(limit=100)
+    all_tasks, _ = service.list_tasks(limit=100, columns=_WORKSPACE_LIST_COLUMNS)
     tasks_with_workspaces = [t for t in all_tasks if t.workspace_path]
 
     if not tasks_with_workspaces:
@@ -1696,22 +1849,12 @@ def list_workspaces() -> str:
         "",
     ]
 
-    for task in tasks_with_workspaces:
-        status_emoji = {
-            TaskStatus.PENDING: "⭕",
-            TaskStatus.IN_PROGRESS: "🔄",
-            TaskStatus.COMPLETED: "✅",
-            TaskStatus.CANCELLED: "❌",
-            TaskStatus.ARCHIVED: "📦",
-            TaskStatus.ASSIGNED: "⭐",
-            TaskStatus.STUCK: "⛔",
-            TaskStatus.REVIEW: "🔍",
-            TaskStatus.INTEGRATE: "✅",
-        }.get(task.status, "❓")
-
-        lines.append(f"{status_emoji} **Task #{task.id}**: {task.title}")
-        lines.append(f"   📁 `{task.workspace_path}`")
-        lines.append("")
+    # One pre-joined block per task (heading, path, blank line)
+    lines.extend(
+        f"{_STATUS_EMOJI.get(task.status, '❓')} **Task #{task.id}**: {task.title}\n"
+        f"   📁 `{task.workspace_path}`\n"
+        for task in tasks_with_workspaces
+    )
 
     lines.extend(["---", "💡 Use `get_workspace_path(task_id)` to get a path for file operations"])
 
@@ -1722,37 +1865,19 @@ def list_workspaces() -> str:
 def get_stats() -> str:
     """Get task statistics and overview."""
     service = get_service()
+    stats = service.get_stats()
 
-    all_tasks, total = service.list_tasks()
-
-    if total == 0:
+    if stats.total == 0:
         return "📊 **Task Statistics**\n\nNo tasks yet. Create your first task to get started!"
 
-    # Status breakdown
-    status_counts = {}
-    for task in all_tasks:
-        status_counts[task.status] = status_counts.get(task.status, 0) + 1
-
-    # Priority breakdown
-    priority_counts = {}
-    for task in all_tasks:
-        priority_counts[task.priority] = priority_counts.get(task.priority, 0) + 1
-
-    # Overdue tasks
-    today = date.today()
-    overdue = [
-        t
-        for t in all_tasks
-        if t.due_date
-        and t.due_date < today
-        and t.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED, TaskStatus.ARCHIVED]
-    ]
+    status_counts = stats.by_status
+    priority_counts = stats.by_priority
 
     # Build stats output
     lines = [
         "📊 **Task Statistics**",
         "",
-        f"**Total Tasks:** {total}",
+        f"**Total Tasks:** {stats.total}",
         "",
         "**By Status:**",
         f"  ⭕ Pending: {status_counts.get(TaskStatus.PENDING, 0)}",
@@ -1766,8 +1891,8 @@ def get_stats() -> str:
         f"  🟢 Low: {priority_counts.get(Priority.LOW, 0)}",
     ]
 
-    if overdue:
-        lines.extend(["", f"⚠️ **Overdue Tasks:** {len(overdue)}"])
+    if stats.overdue:
+        lines.extend(["", f"⚠️ **Overdue Tasks:** {stats.overdue}"])
 
     return "\n".join(lines)
 
@@ -1777,40 +1902,103 @@ def get_stats() -> str:
 # ============================================================================
 
 
+def _memoize_prompt[F: Callable[..., str]](fn: F) -> F:
+    """Cache a prompt builder's output per argument tuple.
+
+    Prompt bodies are pure functions of their (few, hashable) arguments, so
+    repeat calls can reuse the rendered string. A plain ``lru_cache`` object
+    can't be registered with FastMCP, hence the thin function wrapper.
+
+    Args:
+        fn: Prompt function returning a string
+
+    Returns:
+        Function with the same signature that serves cached results
+    """
+    cached = lru_cache(maxsize=8)(fn)
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
+        return cached(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+_TYPE_TEMPLATES = {
+    "feature": {
+        "title": "feat: Add new capability",
+        "example": "User authentication, API endpoint, UI component",
+    },
+    "bug": {
+        "title": "fix: Resolve issue with X",
+        "example": "Login fails on mobile, API returns 500 error",
+    },
+    "docs": {
+        "title": "docs: Update documentation for X",
+        "example": "API reference, README, user guide",
+    },
+    "chore": {
+        "title": "chore: Improve X",
+        "example": "Refactor code, update dependencies, cleanup",
+    },
+    "test": {
+        "title": "test: Add tests for X",
+        "example": "Unit tests, integration tests, E2E tests",
+    },
+}
+
+_FOCUS_GUIDANCE = {
+    "all": "Let's review all your tasks and organize them by priority and status.",
+    "overdue": "Let's review your overdue tasks and create a plan to get back on track.",
+    "high-priority": "Let's review your high-priority tasks and ensure they're on track.",
+    "in-progress": "Let's review what you're currently working on and check progress.",
+}
+
+_PERIOD_CONTEXT = {
+    "day": ("today", "yesterday", "daily"),
+    "week": ("this week", "last week", "weekly"),
+    "sprint": ("this sprint", "last sprint", "sprint"),
+    "month": ("this month", "last month", "monthly"),
+}
+
+# The standup prompt takes no arguments, so it is built once at import.
+_DAILY_STANDUP_PROMPT = """📅 **Daily Standup Report**
+
+Let me help you prepare your standup update based on your tasks.
+
+**Standup Format:**
+
+**Yesterday:**
+- What tasks did I complete? (completed tasks from last 1-2 days)
+- What progress did I make? (updates on in-progress tasks)
+
+**Today:**
+- What am I working on? (current in-progress tasks)
+- What do I plan to complete? (top priorities for today)
+
+**Blockers:**
+- Am I blocked on anything? (tasks with no progress, waiting on others)
+- Do I need help? (high-priority tasks at risk)
+
+**This Week:**
+- What are my key deliverables? (tasks due this week)
+- Am I on track? (overall progress assessment)
+
+Let's generate your standup by looking at your recent task activity!"""
+
+
 @mcp.prompt(
     name="newTask",
     description="Guide user through creating a new task with natural language",
 )
+@_memoize_prompt
 def new_task_prompt(task_type: str = "feature") -> str:
     """Interactive prompt template for creating a new task.
 
     Args:
         task_type: Type of task to create (feature, bug, docs, chore, test)
     """
-    type_templates = {
-        "feature": {
-            "title": "feat: Add new capability",
-            "example": "User authentication, API endpoint, UI component",
-        },
-        "bug": {
-            "title": "fix: Resolve issue with X",
-            "example": "Login fails on mobile, API returns 500 error",
-        },
-        "docs": {
-            "title": "docs: Update documentation for X",
-            "example": "API reference, README, user guide",
-        },
-        "chore": {
-            "title": "chore: Improve X",
-            "example": "Refactor code, update dependencies, cleanup",
-        },
-        "test": {
-            "title": "test: Add tests for X",
-            "example": "Unit tests, integration tests, E2E tests",
-        },
-    }
-
-    template_info = type_templates.get(task_type, type_templates["feature"])
+    template_info = _TYPE_TEMPLATES.get(task_type, _TYPE_TEMPLATES["feature"])
 
     return f"""I'll help you create a new {task_type} task. Let's gather the details:
 
@@ -1847,6 +2035,7 @@ Please provide these details and I'll create the task for you!"""
     name="updateTask",
     description="Guide user through updating an existing task",
 )
+@_memoize_prompt
 def update_task_prompt(task_id: int) -> str:
     """Interactive prompt for updating a task.
 
@@ -1884,6 +2073,7 @@ First, let me show you the current task details. Then tell me what you'd like to
     name="reviewTasks",
     description="Prompt for reviewing and prioritizing tasks",
 )
+@_memoize_prompt
 def review_tasks_prompt(
     focus: str = "all",
 ) -> str:
@@ -1892,14 +2082,7 @@ def review_tasks_prompt(
     Args:
         focus: What to focus on (all, overdue, high-priority, in-progress)
     """
-    focus_guidance = {
-        "all": "Let's review all your tasks and organize them by priority and status.",
-        "overdue": "Let's review your overdue tasks and create a plan to get back on track.",
-        "high-priority": "Let's review your high-priority tasks and ensure they're on track.",
-        "in-progress": "Let's review what you're currently working on and check progress.",
-    }
-
-    guidance = focus_guidance.get(focus, focus_guidance["all"])
+    guidance = _FOCUS_GUIDANCE.get(focus, _FOCUS_GUIDANCE["all"])
 
     return f"""📋 **Task Review Session**
 
@@ -1929,6 +2112,7 @@ Let's start by listing your {focus} tasks!"""
     name="planWork",
     description="Help plan and break down work into manageable tasks",
 )
+@_memoize_prompt
 def plan_work_prompt(
     project: str = "current work",
 ) -> str:
@@ -1975,35 +2159,14 @@ Tell me about {project} and I'll help you create the task breakdown!"""
 )
 def daily_standup_prompt() -> str:
     """Generate a prompt for daily standup format."""
-    return """📅 **Daily Standup Report**
-
-Let me help you prepare your standup update based on your tasks.
-
-**Standup Format:**
-
-**Yesterday:**
-- What tasks did I complete? (completed tasks from last 1-2 days)
-- What progress did I make? (updates on in-progress tasks)
-
-**Today:**
-- What am I working on? (current in-progress tasks)
-- What do I plan to complete? (top priorities for today)
-
-**Blockers:**
-- Am I blocked on anything? (tasks with no progress, waiting on others)
-- Do I need help? (high-priority tasks at risk)
-
-**This Week:**
-- What are my key deliverables? (tasks due this week)
-- Am I on track? (overall progress assessment)
-
-Let's generate your standup by looking at your recent task activity!"""
+    return _DAILY_STANDUP_PROMPT
 
 
 @mcp.prompt(
     name="workOnTask",
     description="Start working on a task with automatic workspace setup",
 )
+@_memoize_prompt
 def work_on_task_prompt(task_id: int) -> str:
     """Generate a prompt for working on a task with workspace context.
 
@@ -2049,6 +2212,7 @@ Let's get started! First, I'll load the task and set up your workspace."""
     name="taskReport",
     description="Generate a comprehensive task status report",
 )
+@_memoize_prompt
 def task_report_prompt(
     period: str = "week",
 ) -> str:
@@ -2057,14 +2221,7 @@ def task_report_prompt(
     Args:
         period: Reporting period (day, week, sprint, month)
     """
-    period_context = {
-        "day": ("today", "yesterday", "daily"),
-        "week": ("this week", "last week", "weekly"),
-        "sprint": ("this sprint", "last sprint", "sprint"),
-        "month": ("this month", "last month", "monthly"),
-    }
-
-    current, previous, adj = period_context.get(period, period_context["week"])
+    current, previous, adj = _PERIOD_CONTEXT.get(period, _PERIOD_CONTEXT["week"])
 
     return f"""📊 **{adj.title()} Task Report**
 
@@ -2107,6 +2264,37 @@ Let's generate your {adj} report!"""
 # ============================================================================
 
 
+# Report layouts for the time tools, filled with str.format on each call
+_CURRENT_TIME_TEMPLATE = """🕐 **Current Time**
+
+**{formatted}**
+
+- **Date:** {date}
+- **Time:** {time}
+- **Day:** {day_of_week}{weekend}
+- **Timezone:** {timezone}
+- **Unix Timestamp:** {unix_timestamp}
+
+**ISO 8601:** `{timestamp}`"""
+
+# Every get_current_time field in one strftime call, split on "|"; the full
+# heading goes last since it is the only field with free text (%Z)
+_CURRENT_TIME_FIELDS = "%Y-%m-%d|%H:%M:%S|%A|%A, %B %d, %Y at %I:%M %p %Z"
+
+_TIME_DELTA_TEMPLATE = """⏱️ **Time Delta**
+
+**{readable}** {direction}
+
+- **Start:** {start}
+- **End:** {end}
+
+**Breakdown:**
+- Days: {days}
+- Hours: {hours}
+- Minutes: {minutes}
+- Total seconds: {total_seconds:,}"""
+
+
 @mcp.tool()
 def get_current_time(timezone: str = "UTC") -> str:
     """Get current timestamp with timezone information.
@@ -2128,37 +2316,50 @@ def get_current_time(timezone: str = "UTC") -> str:
     """
     try:
         tz = ZoneInfo(timezone)
-    except Exception:
+    except (ZoneInfoNotFoundError, ValueError):
+        # Unknown keys raise ZoneInfoNotFoundError; malformed ones ("", "/abs", "../x") ValueError
         return f"❌ Invalid timezone: {timezone}\n\nUse IANA timezone names like: UTC, America/New_York, Europe/London, Asia/Tokyo"
 
-    now = datetime.now(tz)
-
-    result = {
-        "timestamp": now.isoformat(),
-        "timezone": timezone,
-        "unix_timestamp": int(now.timestamp()),
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "day_of_week": now.strftime("%A"),
-        "is_weekend": now.weekday() >= 5,
-        "formatted": now.strftime("%A, %B %d, %Y at %I:%M %p %Z"),
-    }
+    # Read the clock once: the epoch value is exact and the local view is built from it
+    epoch = time.time()
+    now = datetime.fromtimestamp(epoch, tz)
+    date_str, time_str, day_of_week, formatted = now.strftime(_CURRENT_TIME_FIELDS).split("|", 3)
+
+    return _CURRENT_TIME_TEMPLATE.format(
+        formatted=formatted,
+        date=date_str,
+        time=time_str,
+        day_of_week=day_of_week,
+        weekend=" (Weekend)" if now.weekday() >= 5 else "",
+        timezone=timezone,
+        unix_timestamp=int(epoch),
+        timestamp=now.isoformat(),
+    )
 
-    lines = [
-        "🕐 **Current Time**",
-        "",
-        f"**{result['formatted']}**",
-        "",
-        f"- **Date:** {result['date']}",
-        f"- **Time:** {result['time']}",
-        f"- **Day:** {result['day_of_week']}" + (" (Weekend)" if result["is_weekend"] else ""),
-        f"- **Timezone:** {timezone}",
-        f"- **Unix Timestamp:** {result['unix_timestamp']}",
-        "",
-        f"**ISO 8601:** `{result['timestamp']}`",
-    ]
 
-    return "\n".join(lines)
+# strptime fallbacks for format_datetime input that datetime.fromisoformat rejects,
+# most likely first (slash dates; unpadded fields such as "2025-1-5")
+_FALLBACK_DATETIME_FORMATS = ("%Y/%m/%d", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S")
+
+
+def _parse_plain_datetime(timestamp: str) -> datetime:
+    """Parse a timestamp that is not ISO 8601 using the strptime fallback formats.
+
+    Args:
+        timestamp: Datetime string such as "2025/01/15" or "2025-1-5"
+
+    Returns:
+        datetime: Parsed (naive) datetime
+
+    Raises:
+        ValueError: If no supported format matches
+    """
+    for fmt in _FALLBACK_DATETIME_FORMATS:
+        try:
+            return datetime.strptime(timestamp, fmt)
+        except ValueError:
+            continue
+    raise ValueError("Could not parse timestamp")
 
 
 @mcp.tool()
@@ -2184,28 +2385,23 @@ def format_datetime(
         Formatted datetime string or error message
     """
     try:
-        # Parse the input timestamp
-        if "T" in timestamp or "+" in timestamp or timestamp.endswith("Z"):
-            # ISO 8601 format
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        else:
-            # Try common formats
-            for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y/%m/%d"]:
-                try:
-                    dt = datetime.strptime(timestamp, fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
-                raise ValueError("Could not parse timestamp")
+        # Parse the input timestamp: one C-level ISO 8601 attempt (handles "Z",
+        # offsets and date-only input), strptime formats only when that fails
+        try:
+            dt = datetime.fromisoformat(timestamp)
+        except ValueError:
+            dt = _parse_plain_datetime(timestamp)
 
         # Add source timezone if naive
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=ZoneInfo(source_timezone))
 
-        # Convert to target timezone
-        if target_timezone != source_timezone:
-            dt = dt.astimezone(ZoneInfo(target_timezone))
+        # Convert to target timezone. ZoneInfo returns one cached instance per
+        # key, so an identity check skips the no-op conversion; input carrying
+        # its own offset is still converted when source and target names match.
+        target_tz = ZoneInfo(target_timezone)
+        if dt.tzinfo is not target_tz:
+            dt = dt.astimezone(target_tz)
 
         formatted = dt.strftime(format_string)
 
@@ -2215,8 +2411,31 @@ def format_datetime(
         return f"❌ Error formatting datetime: {str(e)}\n\nTip: Use ISO 8601 format (YYYY-MM-DDTHH:MM:SS) for best results"
 
 
+# (singular, plural) labels for the calculate_time_delta summary, largest unit first
+_DELTA_UNITS = (("day", "days"), ("hour", "hours"), ("minute", "minutes"), ("second", "seconds"))
+
+
+def _parse_in_timezone(timestamp: str, tz: ZoneInfo) -> datetime:
+    """Parse an ISO 8601 timestamp, assuming tz when it carries no offset.
+
+    Args:
+        timestamp: ISO 8601 datetime or YYYY-MM-DD date (midnight)
+        tz: Timezone for naive input
+
+    Returns:
+        datetime: Timezone-aware datetime
+
+    Raises:
+        ValueError: If the timestamp is not ISO 8601
+    """
+    dt = datetime.fromisoformat(timestamp)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=tz)
+
+
 @mcp.tool()
-def calculate_time_delta(start: str, end: str = "", timezone: str = "UTC") -> str:
+def calculate_time_delta(
+    start: str, end: str = "", timezone: str = "UTC", max_units: int = 4
+) -> str:
     """Calculate time difference between two dates/times.
 
     Computes duration between two timestamps, or from a timestamp to now.
@@ -2227,31 +2446,23 @@ def calculate_time_delta(start: str, end: str = "", timezone: str = "UTC") -> st
         end: End datetime (ISO 8601 or YYYY-MM-DD format).
              If empty, uses current time.
         timezone: Timezone for calculations (default: UTC)
+        max_units: Most units to show in the summary, largest first (default: 4,
+                   i.e. all). Seconds only appear for deltas under a minute.
 
     Returns:
         Human-readable time difference with breakdown
     """
     try:
-        tz = ZoneInfo(timezone)
+        if max_units < 1:
+            raise ValueError("max_units must be at least 1")
 
-        # Parse start time
-        if "T" in start or "+" in start or start.endswith("Z"):
-            start_dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
-        else:
-            start_dt = datetime.fromisoformat(start + "T00:00:00")
+        tz = ZoneInfo(timezone)
 
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=tz)
+        start_dt = _parse_in_timezone(start, tz)
 
         # Parse or get end time
         if end:
-            if "T" in end or "+" in end or end.endswith("Z"):
-                end_dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
-            else:
-                end_dt = datetime.fromisoformat(end + "T00:00:00")
-
-            if end_dt.tzinfo is None:
-                end_dt = end_dt.replace(tzinfo=tz)
+            end_dt = _parse_in_timezone(end, tz)
         else:
             end_dt = datetime.now(tz)
             end = "now"
@@ -2264,41 +2475,36 @@ def calculate_time_delta(start: str, end: str = "", timezone: str = "UTC") -> st
         is_past = total_seconds < 0
         total_seconds = abs(total_seconds)
 
-        days = total_seconds // 86400
-        hours = (total_seconds % 86400) // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-
-        # Build human-readable output
-        parts = []
-        if days > 0:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
-        if hours > 0:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-        if seconds > 0 and not parts:  # Only show seconds if no larger units
-            parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
+        days, remainder = divmod(total_seconds, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, seconds = divmod(remainder, 60)
+
+        # Build human-readable output (seconds only for deltas under a minute)
+        counts = (days, hours, minutes, 0) if total_seconds >= 60 else (0, 0, 0, seconds)
+        parts = list(
+            islice(
+                (
+                    f"{count} {singular if count == 1 else plural}"
+                    for count, (singular, plural) in zip(counts, _DELTA_UNITS, strict=True)
+                    if count
+                ),
+                max_units,
+            )
+        )
 
         readable = ", ".join(parts) if parts else "0 seconds"
         direction = "ago" if is_past else "from now"
 
-        lines = [
-            "⏱️ **Time Delta**",
-            "",
-            f"**{readable}** {direction}",
-            "",
-            f"- **Start:** {start_dt.strftime('%Y-%m-%d %H:%M:%S %Z')}",
-            f"- **End:** {end if end != 'now' else end_dt.strftime('%Y-%m-%d %H:%M:%S %Z')}",
-            "",
-            "**Breakdown:**",
-            f"- Days: {days}",
-            f"- Hours: {hours}",
-            f"- Minutes: {minutes}",
-            f"- Total seconds: {total_seconds:,}",
-        ]
-
-        return "\n".join(lines)
+        return _TIME_DELTA_TEMPLATE.format(
+            readable=readable,
+            direction=direction,
+            start=start_dt.strftime("%Y-%m-%d %H:%M:%S %Z"),
+            end=end if end != "now" else end_dt.strftime("%Y-%m-%d %H:%M:%S %Z"),
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            total_seconds=total_seconds,
+        )
 
     except Exception as e:
         return f"❌ Error calculating time delta: {str(e)}\n\nTip: Use ISO 8601 format (YYYY-MM-DDTHH:MM:SS) or YYYY-MM-DD"
@@ -2435,7 +2641,7 @@ def consult_episodic_memory(
         for task_id, score in results:
             try:
                 task = service.get_task(task_id)
-                if task.status in [TaskStatus.COMPLETED, TaskStatus.ARCHIVED]:
+                if task.status in _SOLVED_STATUSES:
                     past_solutions.append(
                         {
                             "task_id": task_id,
@@ -0,0 +1,32 @@
+"""Add composite (status, due_date) index for overdue queries.
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d4e5f6a7b8'
+down_revision = 'b2c3d4e5f6g7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the status/due_date index if it doesn't already exist."""
+    # New databases get the index from SQLModel.metadata.create_all
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    indexes = [index['name'] for index in inspector.get_indexes('task')]
+
+    if 'ix_task_status_due_date' not in indexes:
+        op.create_index('ix_task_status_due_date', 'task', ['status', 'due_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the status/due_date index."""
+    op.drop_index('ix_task_status_due_date', table_name='task')
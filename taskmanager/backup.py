@@ -8,6 +8,7 @@ with automatic cleanup to maintain a maximum of 10 backups per profile.
 
 import logging
 import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
@@ -63,6 +64,44 @@ def get_database_path(profile: str) -> Path | None:
     return None
 
 
+def checkpoint_wal(db_path: Path) -> None:
+    """
+    Fold a database's write-ahead log back into the main database file.
+
+    Databases run in WAL mode, where committed transactions can sit in the
+    "-wal" file until SQLite checkpoints them. Call this before copying the
+    database file so the copy includes them.
+
+    Args:
+        db_path: Path to the SQLite database file
+    """
+    if not Path(f"{db_path}-wal").exists():
+        return
+
+    try:
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to checkpoint WAL for {db_path}: {e}")
+
+
+def remove_wal_files(db_path: Path) -> None:
+    """
+    Remove a database's "-wal" and "-shm" files.
+
+    Needed when the database file is replaced or deleted: SQLite would
+    otherwise replay a stale log into the new file.
+
+    Args:
+        db_path: Path to the SQLite database file
+    """
+    for suffix in ("-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+
 def create_backup(profile: str) -> Path | None:
     """
     Create a timestamped backup of the profile database.
@@ -95,6 +134,7 @@ def create_backup(profile: str) -> Path | None:
     backup_path = backup_dir / backup_filename
 
     try:
+        checkpoint_wal(db_path)
         shutil.copy2(db_path, backup_path)
         logger.info(f"Backup created: {backup_path}")
         return backup_path
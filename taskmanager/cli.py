@@ -34,9 +34,10 @@ except ImportError:
 from taskmanager.config import get_settings
 from taskmanager.database import get_session, init_db
 from taskmanager.mcp_discovery import create_ephemeral_session_dir
-from taskmanager.models import Priority, TaskStatus
+from taskmanager.models import TERMINAL_STATUSES, Priority, TaskStatus
 from taskmanager.repository_impl import SQLTaskRepository
 from taskmanager.service import TaskService
+from taskmanager.workspace import find_files_with_matches, scan_workspace_files
 
 # Global automation flag - can be set via environment variable
 _automation_mode = os.getenv("TASKS_AUTOMATION", "").lower() in ("1", "true", "yes")
@@ -44,6 +45,31 @@ _automation_mode = os.getenv("TASKS_AUTOMATION", "").lower() in ("1", "true", "y
 # Initialize Rich console if available
 console = Console() if RICH_AVAILABLE else None
 
+# Status icons for the list table and show output
+_STATUS_ICONS = {
+    TaskStatus.PENDING: "○",
+    TaskStatus.IN_PROGRESS: "◐",
+    TaskStatus.COMPLETED: "✓",
+    TaskStatus.CANCELLED: "✕",
+    TaskStatus.ARCHIVED: "✖",
+}
+
+# Statuses left out of the session context's overdue and priority counts
+_CLOSED_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED})
+
+# Status emoji for search and capture results
+_STATUS_EMOJI = {
+    TaskStatus.PENDING: "⭕",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.COMPLETED: "✅",
+    TaskStatus.CANCELLED: "❌",
+    TaskStatus.ARCHIVED: "📦",
+    TaskStatus.ASSIGNED: "⭐",
+    TaskStatus.STUCK: "⛔",
+    TaskStatus.REVIEW: "🔍",
+    TaskStatus.INTEGRATE: "✅",
+}
+
 
 def print_table(headers, rows):
     """Print a formatted table using Rich if available, otherwise plain text."""
@@ -176,7 +202,7 @@ def cmd_add(args):
         due_date = None
         if args.due:
             try:
-                due_date = datetime.strptime(args.due, "%Y-%m-%d").date()
+                due_date = TaskService.parse_due_date(args.due)
             except ValueError:
                 print("Error: Invalid date format. Use YYYY-MM-DD", file=sys.stderr)
                 sys.exit(1)
@@ -290,23 +316,13 @@ def cmd_list(args):
 
             # Rows
             rows = []
+            today = date.today()
             for task in tasks:
-                status_icons = {
-                    TaskStatus.PENDING: "○",
-                    TaskStatus.IN_PROGRESS: "◐",
-                    TaskStatus.COMPLETED: "✓",
-                    TaskStatus.CANCELLED: "✕",
-                    TaskStatus.ARCHIVED: "✖",
-                }
-                status_display = f"{status_icons.get(task.status, '?')} {task.status.value}"
+                status_display = f"{_STATUS_ICONS.get(task.status, '?')} {task.status.value}"
 
                 due_display = ""
                 if task.due_date:
-                    is_overdue = task.due_date < date.today() and task.status not in [
-                        TaskStatus.COMPLETED,
-                        TaskStatus.CANCELLED,
-                        TaskStatus.ARCHIVED,
-                    ]
+                    is_overdue = task.due_date < today and task.status not in TERMINAL_STATUSES
                     due_display = f"{task.due_date} {'⚠' if is_overdue else ''}"
 
                 row = [
@@ -362,14 +378,7 @@ def cmd_show(args):
         if task.description:
             print(f"Description:\n  {task.description}")
 
-        status_icons = {
-            TaskStatus.PENDING: "○",
-            TaskStatus.IN_PROGRESS: "◐",
-            TaskStatus.COMPLETED: "✓",
-            TaskStatus.CANCELLED: "✕",
-            TaskStatus.ARCHIVED: "✖",
-        }
-        status_icon = status_icons.get(task.status, "?")
+        status_icon = _STATUS_ICONS.get(task.status, "?")
         print(f"Status: {status_icon} {task.status.value}")
         print(f"Priority: {task.priority.value}")
 
@@ -392,11 +401,7 @@ def cmd_show(args):
             )
 
         if task.due_date:
-            is_overdue = task.due_date < date.today() and task.status not in [
-                TaskStatus.COMPLETED,
-                TaskStatus.CANCELLED,
-                TaskStatus.ARCHIVED,
-            ]
+            is_overdue = task.due_date < date.today() and task.status not in TERMINAL_STATUSES
             print(f"Due: {task.due_date} {'⚠ OVERDUE' if is_overdue else ''}")
 
         print(f"Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
@@ -421,7 +426,7 @@ def cmd_update(args):
         due_date = None
         if args.due:
             try:
-                due_date = datetime.strptime(args.due, "%Y-%m-%d").date()
+                due_date = TaskService.parse_due_date(args.due)
             except ValueError:
                 print("Error: Invalid date format. Use YYYY-MM-DD", file=sys.stderr)
                 sys.exit(1)
@@ -481,9 +486,10 @@ def cmd_delete(args):
     """Delete a task permanently."""
     try:
         service = get_service()
-        task = service.get_task(args.task_id)
 
+        # Only the confirmation prompt needs the task loaded up front
         if not args.force and not _automation_mode:
+            task = service.get_task(args.task_id)
             if not confirm_action(f"Delete task #{task.id} '{task.title}'?"):
                 print("Cancelled.")
                 return
@@ -572,77 +578,34 @@ def cmd_search(args):
 
         # Exact text search (fallback or explicit)
         if use_exact:
-            all_tasks, total = service.list_tasks(**filters, limit=100)
-            query_check = query.lower() if not args.case_sensitive else query
-
-            for task in all_tasks:
-                matches = []
-                title_check = task.title.lower() if not args.case_sensitive else task.title
-                if query_check in title_check:
-                    matches.append("title")
-
-                if task.description:
-                    desc_check = (
-                        task.description.lower() if not args.case_sensitive else task.description
-                    )
-                    if query_check in desc_check:
-                        matches.append("description")
-
-                if task.tags:
-                    tags_check = task.tags.lower() if not args.case_sensitive else task.tags
-                    if query_check in tags_check:
-                        matches.append("tags")
-
-                if task.jira_issues:
-                    jira_check = (
-                        task.jira_issues.lower() if not args.case_sensitive else task.jira_issues
-                    )
-                    if query_check in jira_check:
-                        matches.append("JIRA")
-
-                if matches:
-                    exact_matches.append({"task": task, "fields": matches})
+            exact_matches = [
+                {"task": task, "fields": fields}
+                for task, fields in service.search_tasks(
+                    query, case_sensitive=args.case_sensitive, **filters
+                )
+            ]
 
         # Workspace file search (optional)
         if search_workspaces:
             all_tasks, _ = service.list_tasks(**filters, limit=100)
-            for task in all_tasks:
-                if not task.workspace_path or not task.id:
-                    continue
-
-                workspace_path = service.get_workspace_path(task.id)
-                if not workspace_path or not workspace_path.exists():
-                    continue
-
-                try:
-                    rg_args = ["rg", "--color", "never", "--files-with-matches", "--max-count", "5"]
-                    if not args.case_sensitive:
-                        rg_args.append("--ignore-case")
-                    if args.pattern != "*":
-                        rg_args.extend(["--glob", args.pattern])
-                    rg_args.extend(
-                        [
-                            "--glob",
-                            "!.git",
-                            "--glob",
-                            "!tmp/*",
-                            "--glob",
-                            "!*.pyc",
-                            "--glob",
-                            "!__pycache__",
-                        ]
-                    )
-                    rg_args.extend([query, str(workspace_path)])
+            workspace_tasks = {
+                Path(task.workspace_path): task for task in all_tasks if task.workspace_path
+            }
+            try:
+                files_by_workspace = find_files_with_matches(
+                    list(workspace_tasks),
+                    query,
+                    file_pattern=args.pattern,
+                    case_sensitive=args.case_sensitive,
+                )
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                files_by_workspace = {}
 
-                    result = subprocess.run(rg_args, capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        matched_files = result.stdout.strip().split("\n")
-                        matched_files = [
-                            f.replace(str(workspace_path) + "/", "") for f in matched_files if f
-                        ]
-                        workspace_matches.append({"task": task, "files": matched_files})
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    continue
+            workspace_matches = [
+                {"task": task, "files": files_by_workspace[path]}
+                for path, task in workspace_tasks.items()
+                if path in files_by_workspace
+            ]
 
         # Display results
         has_results = semantic_results or exact_matches or workspace_matches
@@ -670,17 +633,7 @@ def cmd_search(args):
             for task_id, score in semantic_results:
                 try:
                     task = service.get_task(task_id)
-                    status_emoji = {
-                        "pending": "⭕",
-                        "in_progress": "🔄",
-                        "completed": "✅",
-                        "cancelled": "❌",
-                        "archived": "📦",
-                        "assigned": "⭐",
-                        "stuck": "⛔",
-                        "review": "🔍",
-                        "integrate": "✅",
-                    }.get(task.status.value, "❓")
+                    status_emoji = _STATUS_EMOJI.get(task.status, "❓")
 
                     normalized_score = score / max_score
                     filled_blocks = int(normalized_score * 10)
@@ -705,13 +658,7 @@ def cmd_search(args):
             for match in exact_matches[:20]:
                 task = match["task"]
                 fields = ", ".join(match["fields"])
-                status_emoji = {
-                    "pending": "⭕",
-                    "in_progress": "🔄",
-                    "completed": "✅",
-                    "cancelled": "❌",
-                    "archived": "📦",
-                }.get(task.status.value, "❓")
+                status_emoji = _STATUS_EMOJI.get(task.status, "❓")
                 print(f"{status_emoji} Task #{task.id}: {task.title}")
                 print(f"   Matched in: {fields}")
                 if task.workspace_path:
@@ -724,13 +671,7 @@ def cmd_search(args):
             for match in workspace_matches[:20]:
                 task = match["task"]
                 files = match["files"]
-                status_emoji = {
-                    "pending": "⭕",
-                    "in_progress": "🔄",
-                    "completed": "✅",
-                    "cancelled": "❌",
-                    "archived": "📦",
-                }.get(task.status.value, "❓")
+                status_emoji = _STATUS_EMOJI.get(task.status, "❓")
                 print(f"{status_emoji} Task #{task.id}: {task.title}")
                 print(f"   Found in {len(files)} file(s):")
                 for f in files[:5]:
@@ -789,17 +730,7 @@ def cmd_capture(args):
                 for task_id, score in similar:
                     try:
                         task = service.get_task(task_id)
-                        status_emoji = {
-                            "pending": "⭕",
-                            "in_progress": "🔄",
-                            "completed": "✅",
-                            "cancelled": "❌",
-                            "archived": "📦",
-                            "assigned": "⭐",
-                            "stuck": "⛔",
-                            "review": "🔍",
-                            "integrate": "✅",
-                        }.get(task.status.value, "❓")
+                        status_emoji = _STATUS_EMOJI.get(task.status, "❓")
                         score_bar = "█" * int(score * 10) + "░" * (10 - int(score * 10))
                         print(f"  {status_emoji} #{task.id}: {task.title}")
                         print(f"     Similarity: [{score_bar}] {score:.0%}")
@@ -1447,32 +1378,21 @@ def cmd_workspace_list(args):
             print(f"Directory not found: {target_path}", file=sys.stderr)
             sys.exit(1)
 
-        # Get matching files
-        if args.pattern == "*":
-            files = list(target_path.rglob("*"))
-        else:
-            files = list(target_path.rglob(args.pattern))
-
-        # Filter to only files
-        files = [f for f in files if f.is_file()]
-        files = [f for f in files if ".git" not in str(f) and "__pycache__" not in str(f)]
+        # Matching files, most recently modified first
+        files = scan_workspace_files(target_path, args.pattern, recursive=not args.no_recursive)
 
         if not files:
             print("No files found")
             sys.exit(0)
 
-        # Sort by modification time
-        files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
         print(f"\nFiles in workspace for task #{args.task_id}")
         print(f"Path: {target_path}")
         print(f"Pattern: {args.pattern}")
         print(f"Found: {len(files)} file(s)\n")
 
-        for f in files[:50]:
-            relative_path = f.relative_to(workspace_path)
-            size = f.stat().st_size
-            modified = datetime.fromtimestamp(f.stat().st_mtime)
+        for path, size, mtime in files[:50]:
+            relative_path = Path(path).relative_to(workspace_path)
+            modified = datetime.fromtimestamp(mtime)
 
             # Format size
             if size < 1024:
@@ -1518,24 +1438,17 @@ def _gather_initial_context(service, settings):
     all_tasks, _ = service.list_tasks(limit=100)  # Get up to 100 tasks for overview
     in_progress = [t for t in all_tasks if t.status == TaskStatus.IN_PROGRESS]
     pending = [t for t in all_tasks if t.status == TaskStatus.PENDING]
+    today = date.today()
     overdue = [
         t
         for t in all_tasks
-        if t.due_date
-        and t.due_date < date.today()
-        and t.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
+        if t.due_date and t.due_date < today and t.status not in _CLOSED_STATUSES
     ]
     high_priority = [
-        t
-        for t in all_tasks
-        if t.priority == Priority.HIGH
-        and t.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
+        t for t in all_tasks if t.priority == Priority.HIGH and t.status not in _CLOSED_STATUSES
     ]
     urgent_priority = [
-        t
-        for t in all_tasks
-        if t.priority == Priority.URGENT
-        and t.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
+        t for t in all_tasks if t.priority == Priority.URGENT and t.status not in _CLOSED_STATUSES
     ]
 
     # Build display text for user (plain text, no Rich formatting)
@@ -1639,15 +1552,12 @@ def cmd_chat(args):
         working_dir = Path.cwd()
         if args.task_id:
             # Get or create workspace for the task
-            workspace_path = service.get_workspace_path(args.task_id)
-            if not workspace_path:
-                print(f"No workspace exists for task #{args.task_id}. Creating one...")
-                service.create_workspace(task_id=args.task_id, initialize_git=True)
-                workspace_path = service.get_workspace_path(args.task_id)
+            workspace_path, new_workspace = service.ensure_workspace(args.task_id)
+            if new_workspace:
+                print(f"No workspace existed for task #{args.task_id}. Created one.")
 
-            if workspace_path:
-                working_dir = workspace_path
-                print(f"Opening chat session for task #{args.task_id}")
+            working_dir = workspace_path
+            print(f"Opening chat session for task #{args.task_id}")
 
         # Prepare environment with MCP server configuration
         env = os.environ.copy()
@@ -2061,7 +1971,12 @@ def cmd_backup_restore(args):
     try:
         import shutil
 
-        from taskmanager.backup import get_database_path, list_backups
+        from taskmanager.backup import (
+            checkpoint_wal,
+            get_database_path,
+            list_backups,
+            remove_wal_files,
+        )
 
         profile = args.profile or "default"
         backups = list_backups(profile)
@@ -2110,10 +2025,12 @@ def cmd_backup_restore(args):
         # Create safety backup of current database
         if db_path.exists():
             safety_backup = Path(f"{db_path}.pre-restore-backup")
+            checkpoint_wal(db_path)
             shutil.copy2(db_path, safety_backup)
             print(f"✓ Current database backed up to: {safety_backup}")
 
-        # Restore from backup
+        # Restore from backup (a leftover WAL would be replayed into the restored file)
+        remove_wal_files(db_path)
         shutil.copy2(backup, db_path)
         print(f"✓ Restored database from: {backup.name}")
         print(f"✓ Database ready at: {db_path}")
@@ -2498,6 +2415,9 @@ def main():
     workspace_list.add_argument(
         "-p", "--pattern", default="*", help="File pattern (e.g., *.py, *.md)"
     )
+    workspace_list.add_argument(
+        "--no-recursive", action="store_true", help="Only list the top level of the directory"
+    )
     workspace_list.set_defaults(func=cmd_workspace_list)
 
     # Chat command
@@ -4,12 +4,14 @@ This module provides functions for creating and managing the database,
 including table creation and engine initialization.
 """
 
+import argparse
 import logging
 import os
 
 from alembic import command
 from alembic.config import Config as AlembicConfig
-from sqlalchemy import Engine
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from taskmanager.backup import backup_before_migration
@@ -19,6 +21,20 @@ from taskmanager.config import create_settings_for_profile
 from taskmanager.models import Attachment, Task, TaskStatus  # noqa: F401
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Enable WAL journaling with NORMAL sync on a new SQLite connection.
+
+    In WAL mode a commit only appends to the -wal file; the database file is
+    synced at checkpoints. With synchronous=NORMAL that makes commits skip their
+    own fsync while staying corruption-safe (a power loss can at most roll back
+    the latest commits).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 def get_engine(profile: str = "default") -> Engine:
     """Get the SQLModel engine for database operations.
 
@@ -31,20 +47,29 @@ def get_engine(profile: str = "default") -> Engine:
     settings = create_settings_for_profile(profile)
     database_url = settings.get_database_url()
 
+    # An in-memory database only exists inside its connection, so every thread and
+    # session must share that one connection (the default pool opens one per thread)
+    pool_args = {"poolclass": StaticPool} if database_url.endswith(":memory:") else {}
+
     # Configure engine with optimizations for SQLite
     engine = create_engine(
         database_url,
         echo=False,  # Set to True for SQL debugging
         connect_args={"check_same_thread": False},  # Needed for SQLite
+        **pool_args,
     )
+    if not pool_args:
+        event.listen(engine, "connect", _set_sqlite_pragmas)
     return engine
 
 
-def init_db(profile: str = "default") -> None:
+def init_db(profile: str = "default", engine: Engine | None = None) -> None:
     """Initialize the database by creating base tables and running Alembic migrations.
 
     Args:
         profile: Database profile to use (default, dev, test)
+        engine: Existing engine for the profile to create tables with
+            (optional, a new engine is created when omitted)
 
     This function:
     1. Creates base tables using SQLModel.metadata.create_all() (task, task_status, etc.)
@@ -53,7 +78,8 @@ def init_db(profile: str = "default") -> None:
     Alembic migrations are applied AFTER base tables exist, allowing migrations to
     safely reference existing tables (e.g., adding the attachment table with FK to task).
     """
-    engine = get_engine(profile)
+    if engine is None:
+        engine = get_engine(profile)
 
     # Step 1: Create base tables using SQLModel (task, task_status, alembic_version)
     # This ensures the task table and core schema exist
@@ -66,6 +92,11 @@ def init_db(profile: str = "default") -> None:
     migrations_dir = os.path.join(os.path.dirname(__file__), '..', 'migrations')
     alembic_ini = os.path.join(os.path.dirname(__file__), '..', 'alembic.ini')
 
+    # In-memory databases get the full schema from create_all above; Alembic would
+    # only open a separate, empty in-memory database
+    if engine.url.database in (None, "", ":memory:"):
+        return
+
     if os.path.exists(alembic_ini):
         # Backup before migration
         backup_before_migration(profile, operation="schema_upgrade")
@@ -74,8 +105,10 @@ def init_db(profile: str = "default") -> None:
         alembic_logger = logging.getLogger('alembic')
         alembic_logger.setLevel(logging.ERROR)
 
-        # Configure Alembic
-        alembic_cfg = AlembicConfig(alembic_ini)
+        # Configure Alembic; migrations/env.py reads the profile from -x profile=...
+        alembic_cfg = AlembicConfig(
+            alembic_ini, cmd_opts=argparse.Namespace(x=[f"profile={profile}"])
+        )
         alembic_cfg.set_main_option('script_location', migrations_dir)
         # Disable Alembic's default logging setup
         # Note: set_section_hook is not a valid AlembicConfig attribute
@@ -6,8 +6,9 @@ including the Task entity and associated enumerations.
 
 from datetime import date, datetime
 from enum import Enum
+from typing import NamedTuple
 
-from sqlmodel import Field, SQLModel, UniqueConstraint
+from sqlmodel import Field, Index, SQLModel, UniqueConstraint
 
 
 class TaskStatus(str, Enum):
@@ -26,6 +27,10 @@ class TaskStatus(str, Enum):
     INTEGRATE = "integrate"  # Approved, ready to merge to main
 
 
+# Statuses that take a task out of active work; tasks in these states are never overdue.
+TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED, TaskStatus.ARCHIVED})
+
+
 class Priority(str, Enum):
     """Priority level for task importance and urgency."""
 
@@ -81,6 +86,9 @@ class Task(SQLModel, table=True):
     # Workspace
     workspace_path: str | None = Field(default=None, description="Path to task-specific LLM agent workspace")
 
+    # Composite index for overdue lookups (status filter + due_date range)
+    __table_args__ = (Index("ix_task_status_due_date", "status", "due_date"),)
+
     def mark_updated(self) -> None:
         """Update the updated_at timestamp to current time."""
         self.updated_at = datetime.now()
@@ -94,6 +102,20 @@ class Task(SQLModel, table=True):
         """Return string representation of task."""
         return f"Task(id={self.id}, title='{self.title}', status={self.status.value})"
 
+
+class TaskSummary(NamedTuple):
+    """Lightweight task row for list views.
+
+    Built from a column-only SELECT, so no ORM instance is constructed.
+    """
+
+    id: int
+    title: str
+    status: TaskStatus
+    priority: Priority
+    due_date: date | None
+
+
 class Attachment(SQLModel, table=True):
     """File attachment associated with a task.
     
@@ -4,10 +4,11 @@ This module defines the repository interface (Protocol) that abstracts
 data access operations, enabling testability and future flexibility.
 """
 
+from collections.abc import Sequence
 from datetime import date
 from typing import Protocol
 
-from taskmanager.models import Priority, Task, TaskStatus
+from taskmanager.models import Priority, Task, TaskStatus, TaskSummary
 
 
 class TaskRepository(Protocol):
@@ -50,6 +51,8 @@ class TaskRepository(Protocol):
         tag: str | None = None,
         limit: int = 20,
         offset: int = 0,
+        overdue_before: date | None = None,
+        columns: Sequence[str] | None = None,
     ) -> list[Task]:
         """List tasks with optional filtering and pagination.
 
@@ -60,18 +63,68 @@ class TaskRepository(Protocol):
             tag: Filter by tag (partial match, optional).
             limit: Maximum number of tasks to return (default: 20).
             offset: Number of tasks to skip for pagination (default: 0).
+            overdue_before: Only open tasks due before this date (optional).
+            columns: Task field names to load; all other columns are deferred
+                (optional, loads every column when omitted).
 
         Returns:
             list[Task]: List of tasks matching the criteria.
         """
         ...
 
+    def list_task_summaries(
+        self,
+        status: TaskStatus | None = None,
+        priority: Priority | None = None,
+        due_before: date | None = None,
+        tag: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        overdue_before: date | None = None,
+    ) -> list[TaskSummary]:
+        """List summary rows with the same filtering, ordering and paging as list_tasks.
+
+        Args:
+            status: Filter by task status (optional).
+            priority: Filter by priority level (optional).
+            due_before: Filter tasks due before this date (optional).
+            tag: Filter by tag (partial match, optional).
+            limit: Maximum number of rows to return (default: 20).
+            offset: Number of rows to skip for pagination (default: 0).
+            overdue_before: Only open tasks due before this date (optional).
+
+        Returns:
+            list[TaskSummary]: Summary rows matching the criteria.
+        """
+        ...
+
+    def search_text(
+        self,
+        query: str,
+        status: TaskStatus | None = None,
+        case_sensitive: bool = False,
+        limit: int = 100,
+    ) -> list[Task]:
+        """Find tasks whose title, description, tags or JIRA issues contain the query.
+
+        Args:
+            query: Substring to look for.
+            status: Filter by task status (optional).
+            case_sensitive: Whether to match case exactly (default: False).
+            limit: Maximum number of tasks to return (default: 100).
+
+        Returns:
+            list[Task]: Matching tasks, most recent first.
+        """
+        ...
+
     def count_tasks(
         self,
         status: TaskStatus | None = None,
         priority: Priority | None = None,
         due_before: date | None = None,
         tag: str | None = None,
+        overdue_before: date | None = None,
     ) -> int:
         """Count tasks matching the given criteria.
 
@@ -80,12 +133,54 @@ class TaskRepository(Protocol):
             priority: Filter by priority level (optional).
             due_before: Filter tasks due before this date (optional).
             tag: Filter by tag (partial match, optional).
+            overdue_before: Only open tasks due before this date (optional).
 
         Returns:
             int: Number of tasks matching the criteria.
         """
         ...
 
+    def count_by_status(self) -> dict[TaskStatus, int]:
+        """Count tasks grouped by status.
+
+        Returns:
+            dict[TaskStatus, int]: Task count per status (statuses with no tasks are omitted).
+        """
+        ...
+
+    def count_by_priority(self) -> dict[Priority, int]:
+        """Count tasks grouped by priority.
+
+        Returns:
+            dict[Priority, int]: Task count per priority (priorities with no tasks are omitted).
+        """
+        ...
+
+    def count_overdue(self, today: date) -> int:
+        """Count open tasks whose due date is before today.
+
+        Args:
+            today: The reference date for the overdue check.
+
+        Returns:
+            int: Number of overdue tasks.
+        """
+        ...
+
+    def count_summary(
+        self, today: date
+    ) -> tuple[dict[TaskStatus, int], dict[Priority, int], int]:
+        """Count tasks by status, by priority and overdue in one query.
+
+        Args:
+            today: The reference date for the overdue check.
+
+        Returns:
+            tuple: (counts per status, counts per priority, overdue count).
+            Statuses and priorities with no tasks are omitted.
+        """
+        ...
+
     def update(self, task: Task) -> Task:
         """Update an existing task.
 
@@ -111,6 +206,17 @@ class TaskRepository(Protocol):
         """
         ...
 
+    def delete_returning_title(self, task_id: int) -> str | None:
+        """Delete a task by ID and return its title.
+
+        Args:
+            task_id: The unique identifier of the task to delete.
+
+        Returns:
+            Optional[str]: The deleted task's title, or None if it wasn't found.
+        """
+        ...
+
     def get_all_used_tags(self) -> list[str]:
         """Get all unique tags currently used across all tasks.
 
@@ -4,11 +4,19 @@ This module provides the concrete implementation of the TaskRepository
 protocol using SQLModel and SQLite for data persistence.
 """
 
+from collections.abc import Sequence
 from datetime import date
 
-from sqlmodel import Session, select
+from sqlalchemy import Select, String, cast, func, literal, or_, union_all
+from sqlalchemy.orm import load_only
+from sqlmodel import Session, delete, select
 
-from taskmanager.models import Priority, Task, TaskStatus
+from taskmanager.models import TERMINAL_STATUSES, Priority, Task, TaskStatus, TaskSummary
+
+
+def _py_lower(value: str | None) -> str | None:
+    """Lowercase a value with Python's Unicode rules (SQLite's lower() is ASCII-only)."""
+    return value.lower() if value is not None else None
 
 
 class SQLTaskRepository:
@@ -60,31 +68,28 @@ class SQLTaskRepository:
         """
         return self.session.get(Task, task_id)
 
-    def list_tasks(
+    def _apply_filters(
         self,
+        statement: Select,
         status: TaskStatus | None = None,
         priority: Priority | None = None,
         due_before: date | None = None,
         tag: str | None = None,
-        limit: int = 20,
-        offset: int = 0,
-    ) -> list[Task]:
-        """List tasks with optional filtering and pagination.
+        overdue_before: date | None = None,
+    ) -> Select:
+        """Add the shared list/count filters to a SELECT statement.
 
         Args:
+            statement: The statement to filter.
             status: Filter by task status (optional).
             priority: Filter by priority level (optional).
-            due_before: Filter tasks due before this date (optional).
+            due_before: Filter tasks due on or before this date (optional).
             tag: Filter by tag (partial match, optional).
-            limit: Maximum number of tasks to return (default: 20).
-            offset: Number of tasks to skip for pagination (default: 0).
+            overdue_before: Only open tasks due before this date (optional).
 
         Returns:
-            list[Task]: List of tasks matching the criteria.
+            Select: The filtered statement.
         """
-        statement = select(Task)
-
-        # Apply filters
         if status is not None:
             statement = statement.where(Task.status == status)
 
@@ -98,8 +103,55 @@ class SQLTaskRepository:
 
         if tag is not None:
             # Filter tasks that contain the tag (supports comma-separated tags)
-            if Task.tags is not None:
-                statement = statement.where(Task.tags.like(f"%{tag}%"))  # type: ignore[union-attr]
+            statement = statement.where(Task.tags.like(f"%{tag}%"))  # type: ignore[union-attr]
+
+        if overdue_before is not None:
+            statement = statement.where(
+                Task.due_date.isnot(None),  # type: ignore[union-attr]
+                Task.due_date < overdue_before,  # type: ignore[operator]
+                Task.status.notin_(TERMINAL_STATUSES),  # type: ignore[attr-defined]
+            )
+
+        return statement
+
+    def list_tasks(
+        self,
+        status: TaskStatus | None = None,
+        priority: Priority | None = None,
+        due_before: date | None = None,
+        tag: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        overdue_before: date | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Task]:
+        """List tasks with optional filtering and pagination.
+
+        Args:
+            status: Filter by task status (optional).
+            priority: Filter by priority level (optional).
+            due_before: Filter tasks due before this date (optional).
+            tag: Filter by tag (partial match, optional).
+            limit: Maximum number of tasks to return (default: 20).
+            offset: Number of tasks to skip for pagination (default: 0).
+            overdue_before: Only open tasks due before this date (optional).
+            columns: Task field names to load; all other columns are deferred
+                (optional, loads every column when omitted).
+
+        Returns:
+            list[Task]: List of tasks matching the criteria.
+        """
+        statement = self._apply_filters(
+            select(Task),
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            tag=tag,
+            overdue_before=overdue_before,
+        )
+
+        if columns:
+            statement = statement.options(load_only(*(getattr(Task, name) for name in columns)))
 
         # Apply ordering (most recent first)
         statement = statement.order_by(Task.created_at.desc())  # type: ignore[attr-defined]
@@ -110,12 +162,98 @@ class SQLTaskRepository:
         results = self.session.exec(statement)
         return list(results.all())
 
+    def list_task_summaries(
+        self,
+        status: TaskStatus | None = None,
+        priority: Priority | None = None,
+        due_before: date | None = None,
+        tag: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        overdue_before: date | None = None,
+    ) -> list[TaskSummary]:
+        """List summary rows with the same filtering, ordering and paging as list_tasks.
+
+        Args:
+            status: Filter by task status (optional).
+            priority: Filter by priority level (optional).
+            due_before: Filter tasks due before this date (optional).
+            tag: Filter by tag (partial match, optional).
+            limit: Maximum number of rows to return (default: 20).
+            offset: Number of rows to skip for pagination (default: 0).
+            overdue_before: Only open tasks due before this date (optional).
+
+        Returns:
+            list[TaskSummary]: Summary rows matching the criteria.
+        """
+        statement = self._apply_filters(
+            select(Task.id, Task.title, Task.status, Task.priority, Task.due_date),
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            tag=tag,
+            overdue_before=overdue_before,
+        )
+        statement = statement.order_by(Task.created_at.desc())  # type: ignore[attr-defined]
+        statement = statement.limit(limit).offset(offset)
+
+        return [TaskSummary._make(row) for row in self.session.exec(statement)]
+
+    def _register_py_lower(self) -> None:
+        """Make py_lower() available on the session's SQLite connection.
+
+        Case-insensitive search folds both sides with Python's str.lower, so
+        non-ASCII text matches the same way it does in Python code. The function
+        is registered once per pooled DBAPI connection.
+        """
+        connection = self.session.connection().connection
+        if "py_lower" not in connection.info:
+            connection.driver_connection.create_function(  # type: ignore[union-attr]
+                "py_lower", 1, _py_lower, deterministic=True
+            )
+            connection.info["py_lower"] = True
+
+    def search_text(
+        self,
+        query: str,
+        status: TaskStatus | None = None,
+        case_sensitive: bool = False,
+        limit: int = 100,
+    ) -> list[Task]:
+        """Find tasks whose title, description, tags or JIRA issues contain the query.
+
+        Args:
+            query: Substring to look for.
+            status: Filter by task status (optional).
+            case_sensitive: Whether to match case exactly (default: False).
+            limit: Maximum number of tasks to return (default: 100).
+
+        Returns:
+            list[Task]: Matching tasks, most recent first.
+        """
+        # instr() matches the query literally, so % and _ need no LIKE escaping
+        fields = (Task.title, Task.description, Task.tags, Task.jira_issues)
+        if case_sensitive:
+            conditions = [func.instr(field, query) > 0 for field in fields]
+        else:
+            self._register_py_lower()
+            needle = query.lower()
+            conditions = [func.instr(func.py_lower(field), needle) > 0 for field in fields]
+
+        statement = self._apply_filters(select(Task), status=status)
+        statement = statement.where(or_(*conditions))
+        statement = statement.order_by(Task.created_at.desc())  # type: ignore[attr-defined]
+        statement = statement.limit(limit)
+
+        return list(self.session.exec(statement).all())
+
     def count_tasks(
         self,
         status: TaskStatus | None = None,
         priority: Priority | None = None,
         due_before: date | None = None,
         tag: str | None = None,
+        overdue_before: date | None = None,
     ) -> int:
         """Count tasks matching the given criteria.
 
@@ -124,31 +262,91 @@ class SQLTaskRepository:
             priority: Filter by priority level (optional).
             due_before: Filter tasks due before this date (optional).
             tag: Filter by tag (partial match, optional).
+            overdue_before: Only open tasks due before this date (optional).
 
         Returns:
             int: Number of tasks matching the criteria.
         """
-        from sqlalchemy import func
-        
-        statement = select(func.count()).select_from(Task)
+        statement = self._apply_filters(
+            select(func.count()).select_from(Task),
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            tag=tag,
+            overdue_before=overdue_before,
+        )
 
-        # Apply filters
-        if status is not None:
-            statement = statement.where(Task.status == status)
+        result = self.session.exec(statement)
+        return result.one()
 
-        if priority is not None:
-            statement = statement.where(Task.priority == priority)
+    def count_by_status(self) -> dict[TaskStatus, int]:
+        """Count tasks grouped by status.
 
-        if due_before is not None:
-            statement = statement.where(
-                Task.due_date.isnot(None), Task.due_date <= due_before  # type: ignore
-            )
+        Returns:
+            dict[TaskStatus, int]: Task count per status (statuses with no tasks are omitted).
+        """
+        statement = select(Task.status, func.count()).group_by(Task.status)
+        return dict(self.session.exec(statement).all())
 
-        if tag is not None:
-            statement = statement.where(Task.tags.like(f"%{tag}%"))  # type: ignore[attr-defined]
+    def count_by_priority(self) -> dict[Priority, int]:
+        """Count tasks grouped by priority.
 
-        result = self.session.exec(statement)
-        return result.one()
+        Returns:
+            dict[Priority, int]: Task count per priority (priorities with no tasks are omitted).
+        """
+        statement = select(Task.priority, func.count()).group_by(Task.priority)
+        return dict(self.session.exec(statement).all())
+
+    def count_overdue(self, today: date) -> int:
+        """Count open tasks whose due date is before today.
+
+        Args:
+            today: The reference date for the overdue check.
+
+        Returns:
+            int: Number of overdue tasks.
+        """
+        return self.count_tasks(overdue_before=today)
+
+    def count_summary(
+        self, today: date
+    ) -> tuple[dict[TaskStatus, int], dict[Priority, int], int]:
+        """Count tasks by status, by priority and overdue in one query.
+
+        The three aggregates are combined with UNION ALL so statistics need a
+        single statement instead of three.
+
+        Args:
+            today: The reference date for the overdue check.
+
+        Returns:
+            tuple: (counts per status, counts per priority, overdue count).
+            Statuses and priorities with no tasks are omitted.
+        """
+        # Enum columns hold member names; cast so the UNION yields plain strings
+        by_status = select(
+            literal("status"), cast(Task.status, String), func.count()
+        ).group_by(Task.status)
+        by_priority = select(
+            literal("priority"), cast(Task.priority, String), func.count()
+        ).group_by(Task.priority)
+        overdue = self._apply_filters(
+            select(literal("overdue"), literal(None, String), func.count()).select_from(Task),
+            overdue_before=today,
+        )
+
+        status_counts: dict[TaskStatus, int] = {}
+        priority_counts: dict[Priority, int] = {}
+        overdue_count = 0
+        statement = union_all(by_status, by_priority, overdue)
+        for kind, name, count in self.session.exec(statement):  # type: ignore[call-overload]
+            if kind == "status":
+                status_counts[TaskStatus[name]] = count
+            elif kind == "priority":
+                priority_counts[Priority[name]] = count
+            else:
+                overdue_count = count
+        return status_counts, priority_counts, overdue_count
 
     def update(self, task: Task) -> Task:
         """Update an existing task.
@@ -189,13 +387,24 @@ class SQLTaskRepository:
         Returns:
             bool: True if task was deleted, False if task wasn't found.
         """
-        task = self.get_by_id(task_id)
-        if task is None:
-            return False
+        return self.delete_returning_title(task_id) is not None
 
-        self.session.delete(task)
+    def delete_returning_title(self, task_id: int) -> str | None:
+        """Delete a task by ID and return its title.
+
+        Uses a single DELETE ... RETURNING statement, so callers that report
+        the deleted title need no SELECT first.
+
+        Args:
+            task_id: The unique identifier of the task to delete.
+
+        Returns:
+            Optional[str]: The deleted task's title, or None if it wasn't found.
+        """
+        statement = delete(Task).where(Task.id == task_id).returning(Task.title)
+        title = self.session.exec(statement).scalar_one_or_none()  # type: ignore[call-overload]
         self.session.commit()
-        return True
+        return title
 
     def get_all_used_tags(self) -> list[str]:
         """Get all unique tags currently used across all tasks.
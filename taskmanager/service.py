@@ -5,7 +5,9 @@ layer (CLI, MCP) and the repository layer, implementing core business
 logic and validation rules.
 """
 
+import re
 import sys
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
@@ -30,7 +32,7 @@ from taskmanager.attachments import (
     serialize_attachments,
 )
 from taskmanager.config import Settings, get_settings
-from taskmanager.models import Priority, Task, TaskStatus, Attachment
+from taskmanager.models import Priority, Task, TaskStatus, TaskSummary, Attachment
 from taskmanager.repository import TaskRepository
 from taskmanager.workspace import WorkspaceManager, WorkspaceMetadata
 
@@ -66,6 +68,16 @@ class ProfileAudit:
     newest_task: Task | None
 
 
+@dataclass
+class TaskStats:
+    """Aggregate task counts for statistics views."""
+
+    total: int
+    by_status: dict[TaskStatus, int]
+    by_priority: dict[Priority, int]
+    overdue: int
+
+
 class TaskService:
     """Service layer for task management business logic.
 
@@ -248,6 +260,9 @@ class TaskService:
         tag: str | None = None,
         limit: int = 20,
         offset: int = 0,
+        overdue_only: bool = False,
+        today: date | None = None,
+        columns: Sequence[str] | None = None,
     ) -> tuple[list[Task], int]:
         """List tasks with filtering and pagination.
 
@@ -258,6 +273,10 @@ class TaskService:
             tag: Filter by tag (exact match, optional).
             limit: Maximum number of tasks to return (default: 20).
             offset: Number of tasks to skip for pagination (default: 0).
+            overdue_only: Only return open tasks that are past their due date.
+            today: Reference date for the overdue check (default: date.today()).
+            columns: Task field names to load for list views; other columns are
+                deferred (optional, loads every column when omitted).
 
         Returns:
             tuple[list[Task], int]: List of tasks and total count.
@@ -265,11 +284,9 @@ class TaskService:
         Raises:
             ValueError: If limit or offset is invalid.
         """
-        if limit < 1 or limit > 100:
-            raise ValueError("Limit must be between 1 and 100")
+        self._validate_page(limit, offset)
 
-        if offset < 0:
-            raise ValueError("Offset must be non-negative")
+        overdue_before = (today or date.today()) if overdue_only else None
 
         tasks = self.repository.list_tasks(
             status=status,
@@ -278,17 +295,179 @@ class TaskService:
             tag=tag,
             limit=limit,
             offset=offset,
+            overdue_before=overdue_before,
+            columns=columns,
         )
 
+        # A short page already gives the total; only a full page (more rows may
+        # follow) or one past the end needs the separate COUNT query
+        if len(tasks) < limit and (tasks or offset == 0):
+            return tasks, offset + len(tasks)
+
         total = self.repository.count_tasks(
             status=status,
             priority=priority,
             due_before=due_before,
             tag=tag,
+            overdue_before=overdue_before,
         )
 
         return tasks, total
 
+    def list_task_summaries(
+        self,
+        status: TaskStatus | None = None,
+        priority: Priority | None = None,
+        due_before: date | None = None,
+        tag: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        overdue_only: bool = False,
+        today: date | None = None,
+    ) -> tuple[list[TaskSummary], int]:
+        """List lightweight task rows with filtering and pagination.
+
+        Takes the same filters as list_tasks but returns TaskSummary tuples
+        (id, title, status, priority, due_date) without building ORM objects.
+
+        Args:
+            status: Filter by task status (optional).
+            priority: Filter by priority level (optional).
+            due_before: Filter tasks due before this date (optional).
+            tag: Filter by tag (exact match, optional).
+            limit: Maximum number of tasks to return (default: 20).
+            offset: Number of tasks to skip for pagination (default: 0).
+            overdue_only: Only return open tasks that are past their due date.
+            today: Reference date for the overdue check (default: date.today()).
+
+        Returns:
+            tuple[list[TaskSummary], int]: Summary rows and total count.
+
+        Raises:
+            ValueError: If limit or offset is invalid.
+        """
+        self._validate_page(limit, offset)
+
+        overdue_before = (today or date.today()) if overdue_only else None
+
+        summaries = self.repository.list_task_summaries(
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            tag=tag,
+            limit=limit,
+            offset=offset,
+            overdue_before=overdue_before,
+        )
+
+        # A short page already gives the total; only a full page (more rows may
+        # follow) or one past the end needs the separate COUNT query
+        if len(summaries) < limit and (summaries or offset == 0):
+            return summaries, offset + len(summaries)
+
+        total = self.repository.count_tasks(
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            tag=tag,
+            overdue_before=overdue_before,
+        )
+
+        return summaries, total
+
+    def count_tasks(
+        self,
+        status: TaskStatus | None = None,
+        priority: Priority | None = None,
+        due_before: date | None = None,
+        tag: str | None = None,
+        overdue_only: bool = False,
+        today: date | None = None,
+    ) -> int:
+        """Count tasks matching the list_tasks filters without loading any rows.
+
+        Args:
+            status: Filter by task status (optional).
+            priority: Filter by priority level (optional).
+            due_before: Filter tasks due before this date (optional).
+            tag: Filter by tag (exact match, optional).
+            overdue_only: Only count open tasks that are past their due date.
+            today: Reference date for the overdue check (default: date.today()).
+
+        Returns:
+            int: Number of matching tasks.
+        """
+        return self.repository.count_tasks(
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            tag=tag,
+            overdue_before=(today or date.today()) if overdue_only else None,
+        )
+
+    def search_tasks(
+        self,
+        query: str,
+        status: TaskStatus | None = None,
+        case_sensitive: bool = False,
+        limit: int = 100,
+    ) -> list[tuple[Task, list[str]]]:
+        """Find tasks whose text fields contain the query.
+
+        Matching runs in the database; only the returned rows are checked again
+        to report which fields matched.
+
+        Args:
+            query: Substring to look for.
+            status: Filter by task status (optional).
+            case_sensitive: Whether to match case exactly (default: False).
+            limit: Maximum number of tasks to return (default: 100).
+
+        Returns:
+            list[tuple[Task, list[str]]]: Matching tasks (most recent first), each
+                paired with the matched field labels ("title", "description",
+                "tags", "JIRA").
+
+        Raises:
+            ValueError: If limit is invalid.
+        """
+        self._validate_page(limit, 0)
+
+        tasks = self.repository.search_text(
+            query, status=status, case_sensitive=case_sensitive, limit=limit
+        )
+
+        # One compiled pattern folds case while scanning, instead of lowercasing each field
+        pattern = re.compile(re.escape(query), 0 if case_sensitive else re.IGNORECASE)
+        results = []
+        for task in tasks:
+            fields = [
+                label
+                for label, value in (
+                    ("title", task.title),
+                    ("description", task.description),
+                    ("tags", task.tags),
+                    ("JIRA", task.jira_issues),
+                )
+                if value and pattern.search(value)
+            ]
+            results.append((task, fields))
+
+        return results
+
+    @staticmethod
+    def _validate_page(limit: int, offset: int) -> None:
+        """Validate pagination arguments.
+
+        Raises:
+            ValueError: If limit or offset is invalid.
+        """
+        if limit < 1 or limit > 100:
+            raise ValueError("Limit must be between 1 and 100")
+
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+
     def update_task(
         self,
         task_id: int,
@@ -388,20 +567,35 @@ class TaskService:
         Returns:
             bool: True if task was deleted.
 
+        Raises:
+            ValueError: If task_id is invalid or task not found.
+        """
+        self.delete_task_returning_title(task_id)
+        return True
+
+    def delete_task_returning_title(self, task_id: int) -> str:
+        """Delete a task and return its title, in a single statement.
+
+        Args:
+            task_id: The unique identifier of the task to delete.
+
+        Returns:
+            str: The deleted task's title.
+
         Raises:
             ValueError: If task_id is invalid or task not found.
         """
         if task_id < 1:
             raise ValueError("Task ID must be positive")
 
-        result = self.repository.delete(task_id)
-        if not result:
+        title = self.repository.delete_returning_title(task_id)
+        if title is None:
             raise ValueError(f"Task with ID {task_id} not found")
 
         # Remove from semantic search index
         self._remove_task_from_index(task_id)
 
-        return result
+        return title
 
     def get_overdue_tasks(self) -> list[Task]:
         """Get all overdue tasks.
@@ -431,18 +625,60 @@ class TaskService:
         Returns:
             dict[str, int]: Dictionary with task counts by status and priority.
         """
+        stats = self.get_stats()
         return {
-            "total": self.repository.count_tasks(),
-            "pending": self.repository.count_tasks(status=TaskStatus.PENDING),
-            "in_progress": self.repository.count_tasks(status=TaskStatus.IN_PROGRESS),
-            "completed": self.repository.count_tasks(status=TaskStatus.COMPLETED),
-            "archived": self.repository.count_tasks(status=TaskStatus.ARCHIVED),
-            "low_priority": self.repository.count_tasks(priority=Priority.LOW),
-            "medium_priority": self.repository.count_tasks(priority=Priority.MEDIUM),
-            "high_priority": self.repository.count_tasks(priority=Priority.HIGH),
-            "urgent_priority": self.repository.count_tasks(priority=Priority.URGENT),
+            "total": stats.total,
+            "pending": stats.by_status.get(TaskStatus.PENDING, 0),
+            "in_progress": stats.by_status.get(TaskStatus.IN_PROGRESS, 0),
+            "completed": stats.by_status.get(TaskStatus.COMPLETED, 0),
+            "archived": stats.by_status.get(TaskStatus.ARCHIVED, 0),
+            "low_priority": stats.by_priority.get(Priority.LOW, 0),
+            "medium_priority": stats.by_priority.get(Priority.MEDIUM, 0),
+            "high_priority": stats.by_priority.get(Priority.HIGH, 0),
+            "urgent_priority": stats.by_priority.get(Priority.URGENT, 0),
         }
 
+    def get_stats(self, today: date | None = None) -> TaskStats:
+        """Get task counts by status and priority plus the overdue count.
+
+        All counting happens in SQL, in a single statement, so the cost does
+        not grow with the number of tasks loaded into memory.
+
+        Args:
+            today: Reference date for the overdue check (default: date.today()).
+
+        Returns:
+            TaskStats: Total, per-status, per-priority and overdue counts.
+        """
+        by_status, by_priority, overdue = self.repository.count_summary(today or date.today())
+        return TaskStats(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_priority=by_priority,
+            overdue=overdue,
+        )
+
+    @staticmethod
+    def parse_due_date(value: str) -> date:
+        """Parse a YYYY-MM-DD due date string.
+
+        Uses the C-implemented date.fromisoformat rather than strptime, which
+        re-parses its format string on every call.
+
+        Args:
+            value: Date string in YYYY-MM-DD format.
+
+        Returns:
+            date: The parsed date.
+
+        Raises:
+            ValueError: If the string is not a valid YYYY-MM-DD date.
+        """
+        # fromisoformat also accepts compact/week forms (20250115, 2025-W03-3)
+        if len(value) != 10 or value[4] != "-" or value[7] != "-":
+            raise ValueError(f"Invalid date format: {value}")
+        return date.fromisoformat(value)
+
     @staticmethod
     def format_jira_links(jira_issues: str | None, jira_url: str | None) -> list[str]:
         """Format JIRA issue keys into full URLs.
@@ -805,9 +1041,46 @@ class TaskService:
         if task.workspace_path:
             raise ValueError(f"Workspace already exists for task #{task_id}")
 
-        # Create workspace
+        return self._create_workspace_for(task, initialize_git)
+
+    def ensure_workspace(
+        self, task_id: int, initialize_git: bool = True
+    ) -> tuple[Path, WorkspaceMetadata | None]:
+        """Get a task's workspace path, creating the workspace if there is none.
+
+        The task is loaded once for both the check and the create.
+
+        Args:
+            task_id: The task ID
+            initialize_git: Whether to initialize a git repository when creating
+
+        Returns:
+            tuple: Workspace path, and the new workspace's metadata (None if the
+                workspace already existed)
+
+        Raises:
+            ValueError: If task not found
+        """
+        task = self.get_task(task_id)
+
+        if task.workspace_path:
+            return Path(task.workspace_path), None
+
+        metadata = self._create_workspace_for(task, initialize_git)
+        return Path(metadata["workspace_path"]), metadata
+
+    def _create_workspace_for(self, task: Task, initialize_git: bool) -> WorkspaceMetadata:
+        """Create the workspace directory for a loaded task and record its path.
+
+        Args:
+            task: Task without a workspace
+            initialize_git: Whether to initialize a git repository
+
+        Returns:
+            Workspace metadata
+        """
         metadata = self.workspace_manager.create_workspace(
-            task_id=task_id, initialize_git=initialize_git
+            task_id=task.id, initialize_git=initialize_git
         )
 
         # Update task with workspace path
@@ -846,6 +1119,23 @@ class TaskService:
         Returns:
             bool: True if workspace was deleted
 
+        Raises:
+            ValueError: If task not found
+        """
+        return self.delete_workspace_if_exists(task_id)[1]
+
+    def delete_workspace_if_exists(self, task_id: int) -> tuple[Path | None, bool]:
+        """Delete a task's workspace, reporting where it was.
+
+        The task is loaded once for both the existence check and the delete.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            tuple: Workspace path (None if the task had no workspace) and whether
+                the workspace was deleted
+
         Raises:
             ValueError: If task not found
         """
@@ -853,7 +1143,9 @@ class TaskService:
         task = self.get_task(task_id)
 
         if not task.workspace_path:
-            return False
+            return None, False
+
+        path = Path(task.workspace_path)
 
         # Delete workspace
         deleted = self.workspace_manager.delete_workspace(task_id)
@@ -864,7 +1156,7 @@ class TaskService:
             task.mark_updated()
             self.repository.update(task)
 
-        return deleted
+        return path, deleted
 
     def get_workspace_path(self, task_id: int) -> Path | None:
         """Get the workspace path for a task.
@@ -1045,6 +1337,7 @@ class TaskService:
         Raises:
             ValueError: If trying to delete a built-in profile or profile not found
         """
+        from taskmanager.backup import remove_wal_files
         from taskmanager.config import get_user_config_path
 
         # Prevent deletion of built-in profiles
@@ -1059,6 +1352,7 @@ class TaskService:
 
         if db_path.exists():
             db_path.unlink()
+        remove_wal_files(db_path)
 
         # Remove from settings.toml if configured
         config_path = get_user_config_path()
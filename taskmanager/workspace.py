@@ -4,10 +4,12 @@ This module handles persistent workspaces for tasks, allowing LLM agents
 to store context, code, logs, and other artifacts in task-specific directories.
 """
 
+import fnmatch
 import json
+import os
 import subprocess
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import TypedDict
 
 
@@ -307,3 +309,125 @@ Thumbs.db
                 count += 1
 
         return count
+
+
+# Globs excluded from every workspace content search
+SEARCH_EXCLUDE_GLOBS = ("!.git", "!tmp/*", "!*.pyc", "!__pycache__")
+
+# Larger files (ripgrep --max-filesize syntax) are skipped by every workspace content search
+SEARCH_MAX_FILESIZE = "10M"
+
+# Fixed ripgrep flags shared by every workspace content search, built once at import.
+# The exclusion globs go after any caller glob: ripgrep lets later globs win.
+RG_BASE_ARGS = ("--color", "never", "--max-filesize", SEARCH_MAX_FILESIZE)
+RG_EXCLUDE_ARGS = tuple(arg for glob in SEARCH_EXCLUDE_GLOBS for arg in ("--glob", glob))
+
+
+def find_files_with_matches(
+    workspace_paths: list[Path],
+    query: str,
+    file_pattern: str = "*",
+    case_sensitive: bool = False,
+    timeout: float = 10,
+) -> dict[Path, list[str]]:
+    """Find workspace files containing a pattern, using one ripgrep run for all workspaces.
+
+    Only file names are collected: ripgrep stops reading a file at its first
+    match. Matching lines for a single workspace come from the search_workspace
+    MCP tool when the caller drills in. Files larger than SEARCH_MAX_FILESIZE
+    are not searched.
+
+    Args:
+        workspace_paths: Workspace directories to search (missing ones are
+            skipped by ripgrep, so callers need not check them first)
+        query: Pattern to search for (ripgrep regex syntax)
+        file_pattern: Glob limiting which files are searched (default: all files)
+        case_sensitive: Whether to match case exactly
+        timeout: Seconds before the search is aborted
+
+    Returns:
+        Matching file paths relative to their workspace, keyed by workspace path.
+        Workspaces without matches are omitted.
+
+    Raises:
+        FileNotFoundError: If ripgrep is not installed
+        subprocess.TimeoutExpired: If the search takes longer than timeout
+    """
+    if not workspace_paths:
+        return {}
+
+    # --null ends each path with NUL, so file names containing newlines split correctly
+    rg_args = ["rg", *RG_BASE_ARGS, "--files-with-matches", "--null"]
+    if not case_sensitive:
+        rg_args.append("--ignore-case")
+    if file_pattern != "*":
+        rg_args.extend(["--glob", file_pattern])
+    rg_args.extend(RG_EXCLUDE_ARGS)
+    rg_args.extend(["--", query, *(str(path) for path in workspace_paths)])
+
+    # Exit status 2 also covers per-file errors (e.g. unreadable files), so the
+    # matches that were printed are used regardless of the exit status
+    result = subprocess.run(rg_args, capture_output=True, timeout=timeout)
+
+    # One decode of the whole output; fsdecode keeps non-UTF-8 file names intact
+    roots = {str(path): path for path in workspace_paths}
+    matches: dict[Path, list[str]] = {}
+    for line in os.fsdecode(result.stdout).split("\0"):
+        if not line:
+            continue
+        file_path = Path(line)
+        for parent in file_path.parents:
+            root = roots.get(str(parent))
+            if root is not None:
+                matches.setdefault(root, []).append(str(file_path.relative_to(parent)))
+                break
+
+    return matches
+
+
+def scan_workspace_files(
+    root: Path, pattern: str = "*", recursive: bool = True
+) -> list[tuple[str, int, float]]:
+    """List files under a workspace directory with their size and modification time.
+
+    Walks the tree with os.scandir, so each file is stat'ed once and excluded
+    directories are never entered. Entries whose name contains ".git" or
+    "__pycache__" are skipped, and symlinked directories are not followed.
+
+    Args:
+        root: Directory to walk
+        pattern: Glob matched against file names, or against the trailing path
+            components when it contains "/" (same as Path.rglob)
+        recursive: Whether to descend into subdirectories (default: True); when
+            False only root itself is read
+
+    Returns:
+        (path, size in bytes, mtime) tuples, most recently modified first
+    """
+    match_name = "/" not in pattern
+
+    files: list[tuple[str, int, float]] = []
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Unreadable directories are skipped, as Path.rglob does
+            continue
+        with entries:
+            for entry in entries:
+                if ".git" in entry.name or "__pycache__" in entry.name:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.is_file() and (
+                    fnmatch.fnmatchcase(entry.name, pattern)
+                    if match_name
+                    else PurePath(os.path.relpath(entry.path, root)).match(pattern)
+                ):
+                    stat = entry.stat()
+                    files.append((entry.path, stat.st_size, stat.st_mtime))
+
+    files.sort(key=lambda file: file[2], reverse=True)
+    return files
@@ -355,6 +355,31 @@ class TestIntegration:
             assert result[0] == "hello"
             conn.close()
     
+    def test_backup_includes_wal_transactions(self, tmp_path):
+        """Backup should include commits still held in the write-ahead log."""
+        config_dir = tmp_path / ".config" / "taskmanager"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Keep a connection open so the commit stays in tasks.db-wal
+        db_file = config_dir / "tasks.db"
+        conn = sqlite3.connect(str(db_file))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("INSERT INTO test (name) VALUES ('in wal')")
+        conn.commit()
+        
+        try:
+            with patch('taskmanager.backup.Path.home', return_value=tmp_path):
+                backup_path = create_backup("default")
+        finally:
+            conn.close()
+        
+        backup_conn = sqlite3.connect(str(backup_path))
+        result = backup_conn.execute("SELECT name FROM test").fetchone()
+        backup_conn.close()
+        assert result[0] == "in wal"
+    
     def test_multiple_profiles_independent(self, tmp_path):
         """Backups for different profiles should be independent."""
         config_dir = tmp_path / ".config" / "taskmanager"
@@ -1,9 +1,24 @@
 """Unit tests for MCP server status mapping functions."""
 
+import json
+import os
+import subprocess
+import sys
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
 import pytest
 
-from taskmanager.models import TaskStatus
-from mcp_server.server import mcp_status_to_task_status, task_status_to_mcp_status
+from mcp_server import server
+from taskmanager.models import Priority, Task, TaskStatus
+from mcp_server.server import (
+    format_task_row,
+    get_service,
+    mcp_status_to_task_status,
+    task_status_to_mcp_status,
+)
+from taskmanager.workspace import scan_workspace_files
 
 
 class TestStatusMapping:
@@ -87,3 +102,350 @@ class TestStatusMapping:
         
         with pytest.raises(ValueError):
             mcp_status_to_task_status("Done")
+
+
+class TestServiceCache:
+    """Test that get_service reuses services across tool calls."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_service_cache(self, monkeypatch):
+        """Start each test with empty engine/service caches (in-memory test profile only)."""
+        monkeypatch.setattr(server, "_engines", {})
+        monkeypatch.setattr(server, "_initialized_profiles", set())
+        monkeypatch.setattr(server, "_thread_services", threading.local())
+
+    def test_same_service_per_profile(self):
+        """Test that repeated calls on one thread return the same service."""
+        assert get_service("test") is get_service("test")
+
+    def test_profile_initialized_on_first_use(self):
+        """Test that get_service initializes a profile's database lazily."""
+        assert "test" not in server._initialized_profiles
+        get_service("test")
+        assert "test" in server._initialized_profiles
+
+    def test_separate_service_per_thread(self):
+        """Test that each thread gets its own service (sessions are not thread-safe)."""
+        main_service = get_service("test")
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_service("test")))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_service
+        assert other[0].session.get_bind() is main_service.session.get_bind()
+
+    def test_in_memory_profile_shared_across_threads(self):
+        """Test that worker threads see the same in-memory test database."""
+        task_id = get_service("test").create_task(title="Shared").id
+        titles = []
+        thread = threading.Thread(
+            target=lambda: titles.append(get_service("test").get_task(task_id).title)
+        )
+        thread.start()
+        thread.join()
+
+        assert titles == ["Shared"]
+
+
+class TestSearchAllTasks:
+    """Test the search_all_tasks tool against the in-memory test profile."""
+
+    def test_metadata_only_search_skips_task_listing(self, monkeypatch):
+        """Test that search_workspaces=False counts tasks instead of loading rows."""
+        service = get_service("test")
+        service.create_task(title="Quarterly zebra report")
+
+        def fail(**kwargs):
+            raise AssertionError("task rows should not be listed")
+
+        monkeypatch.setattr(service, "list_tasks", fail)
+        monkeypatch.setattr(service, "list_task_summaries", fail)
+        result = server.search_all_tasks("ZEBRA", search_workspaces=False, profile="test")
+
+        assert "Quarterly zebra report" in result
+        assert "Matched in: title" in result
+
+
+class TestFormatTaskRow:
+    """Test the one-line task format used by list_tasks."""
+
+    def test_overdue_open_task_is_flagged(self):
+        """Test that an open task past its due date is marked overdue."""
+        task = Task(id=3, title="Ship it", priority=Priority.HIGH, due_date=date(2025, 1, 1))
+
+        row = format_task_row(task, today=date(2025, 1, 2))
+
+        assert row == "⭕ 🔴 **#3** Ship it | Due: 2025-01-01 ⚠️ OVERDUE"
+
+    def test_terminal_task_is_not_flagged(self):
+        """Test that completed tasks are never marked overdue."""
+        task = Task(id=4, title="Done", status=TaskStatus.COMPLETED, due_date=date(2025, 1, 1))
+
+        row = format_task_row(task, today=date(2025, 1, 2))
+
+        assert "OVERDUE" not in row
+
+
+class TestPromptCache:
+    """Test that prompt templates are rendered once per argument set."""
+
+    def test_repeat_calls_reuse_rendered_prompt(self):
+        """Test that identical arguments return the same string object."""
+        first = server.task_report_prompt("day")
+
+        assert server.task_report_prompt("day") is first
+        assert server.task_report_prompt("month") != first
+
+    def test_standup_prompt_is_constant(self):
+        """Test that the argument-less standup prompt is built once."""
+        assert server.daily_standup_prompt() is server.daily_standup_prompt()
+
+
+class TestParsePlainDatetime:
+    """Test the strptime fallback parsing for the format_datetime tool."""
+
+    def test_dashed_formats_parse(self):
+        """Test that dashed date and date-time strings parse."""
+        assert server._parse_plain_datetime("2025-01-15") == datetime(2025, 1, 15)
+        assert server._parse_plain_datetime("2025-01-15 10:20:30") == datetime(
+            2025, 1, 15, 10, 20, 30
+        )
+
+    def test_other_formats_fall_back_to_strptime(self):
+        """Test that slash-separated and unpadded dates still parse."""
+        assert server._parse_plain_datetime("2025/01/15") == datetime(2025, 1, 15)
+        assert server._parse_plain_datetime("2025-1-5") == datetime(2025, 1, 5)
+
+    def test_unparseable_raises(self):
+        """Test that unsupported strings raise ValueError."""
+        with pytest.raises(ValueError):
+            server._parse_plain_datetime("2025-01-15X10:20:30")
+
+
+class TestFormatDatetime:
+    """Test timezone handling in the format_datetime tool."""
+
+    def test_offset_input_converted_to_target(self):
+        """Test that input with its own offset is converted even when zones match."""
+        result = server.format_datetime("2025-01-15T10:30:00+02:00", "%H:%M %Z")
+        assert result.startswith("✓ Formatted: **08:30 UTC**")
+
+    def test_naive_input_uses_source_zone(self):
+        """Test that naive input is read in the source zone, then converted."""
+        result = server.format_datetime(
+            "2025-01-15 10:30:00", "%H:%M %Z", "America/New_York", "Europe/London"
+        )
+        assert result.startswith("✓ Formatted: **15:30 GMT**")
+
+
+class TestGetCurrentTime:
+    """Test timezone validation in the get_current_time tool."""
+
+    @pytest.mark.parametrize("timezone", ["Bad/Zone", "", "../etc/passwd", "Europe/"])
+    def test_invalid_timezone_reported(self, timezone):
+        """Test that unknown and malformed zone names return the error message."""
+        assert server.get_current_time(timezone).startswith("❌ Invalid timezone")
+
+    def test_valid_timezone(self):
+        """Test that a valid zone is echoed in the report."""
+        assert "- **Timezone:** Asia/Tokyo" in server.get_current_time("Asia/Tokyo")
+
+
+class TestCalculateTimeDelta:
+    """Test the summary line of the calculate_time_delta tool."""
+
+    def test_all_units_by_default(self):
+        """Test that every non-zero unit down to minutes is shown by default."""
+        result = server.calculate_time_delta("2025-01-01T00:00:00", "2025-01-03T05:07:09")
+        assert "**2 days, 5 hours, 7 minutes** from now" in result
+
+    def test_max_units_keeps_largest(self):
+        """Test that max_units truncates the summary to the largest units."""
+        result = server.calculate_time_delta(
+            "2025-01-03T05:07:09", "2025-01-01T00:00:00", max_units=1
+        )
+        assert "**2 days** ago" in result
+
+    def test_seconds_only_under_a_minute(self):
+        """Test that seconds are reported for deltas shorter than a minute."""
+        result = server.calculate_time_delta("2025-01-01T00:00:00", "2025-01-01T00:00:42")
+        assert "**42 seconds** from now" in result
+
+    def test_max_units_must_be_positive(self):
+        """Test that a non-positive max_units is reported as an error."""
+        result = server.calculate_time_delta("2025-01-01", "2025-01-02", max_units=0)
+        assert result.startswith("❌ Error calculating time delta: max_units must be at least 1")
+
+
+class TestPackUpdates:
+    """Test the shared update validation used by update_task and its form."""
+
+    def test_packs_and_converts_values(self):
+        """Test that priority, status and due date are converted."""
+        updates, error = server._pack_updates(
+            priority="high", status="done", due_date="2025-03-01", tags="a,b"
+        )
+
+        assert error is None
+        assert updates == {
+            "priority": Priority.HIGH,
+            "status": TaskStatus.COMPLETED,
+            "due_date": date(2025, 3, 1),
+            "tags": "a,b",
+        }
+
+    def test_strip_strings_skips_blank_fields(self):
+        """Test that form input is stripped and blank fields are ignored."""
+        updates, error = server._pack_updates(
+            title="  New title ", description="   ", status=" stuck ", strip_strings=True
+        )
+
+        assert error is None
+        assert updates == {"title": "New title", "status": TaskStatus.STUCK}
+
+    def test_empty_string_kept_without_strip(self):
+        """Test that the tool path can clear a field with an empty string."""
+        updates, _ = server._pack_updates(description="")
+
+        assert updates == {"description": ""}
+
+    def test_invalid_value_returns_error(self):
+        """Test that invalid values produce an error message and no updates."""
+        updates, error = server._pack_updates(title="x", due_date="01/02/2025")
+
+        assert updates == {}
+        assert error == "❌ Invalid date format: 01/02/2025. Use YYYY-MM-DD"
+
+
+class TestFormatRgJson:
+    """Test parsing of ripgrep JSON output for search_workspace."""
+
+    def test_counts_files_and_matches(self):
+        """Test that counts come from events, even when lines contain colons."""
+        events = [
+            {"type": "begin", "data": {"path": {"text": "/ws/notes/a.md"}}},
+            {
+                "type": "match",
+                "data": {
+                    "path": {"text": "/ws/notes/a.md"},
+                    "lines": {"text": "key: needle\n"},
+                    "line_number": 3,
+                },
+            },
+            {"type": "end", "data": {"path": {"text": "/ws/notes/a.md"}}},
+            {"type": "begin", "data": {"path": {"text": "/ws/code/x.py"}}},
+            {
+                "type": "match",
+                "data": {
+                    "path": {"text": "/ws/code/x.py"},
+                    "lines": {"bytes": "bmVlZGxl/w0K"},
+                    "line_number": 7,
+                },
+            },
+            {"type": "end", "data": {"path": {"text": "/ws/code/x.py"}}},
+            {"type": "summary", "data": {}},
+        ]
+        output = "\n".join(json.dumps(event) for event in events)
+
+        file_count, match_count, text = server._format_rg_json(output.splitlines())
+
+        assert (file_count, match_count) == (2, 2)
+        assert text == "/ws/notes/a.md\n3:key: needle\n\n/ws/code/x.py\n7:needle�"
+
+    def test_empty_output(self):
+        """Test that no output means no matches."""
+        assert server._format_rg_json([]) == (0, 0, "")
+
+    def test_long_lines_truncated(self):
+        """Test that a minified-style line is cut instead of returned whole."""
+        match = {"path": {"text": "a"}, "lines": {"text": "x" * 5000}, "line_number": 1}
+        output = [json.dumps({"type": "match", "data": match})]
+
+        text = server._format_rg_json(output)[2]
+
+        assert text == "1:" + "x" * 500 + " [... line truncated]"
+
+    def test_stops_at_max_matches(self):
+        """Test that reading stops once max_matches lines are collected."""
+
+        def events():
+            yield json.dumps({"type": "begin", "data": {"path": {"text": "a"}}})
+            for number in range(1, 1000):
+                match = {"path": {"text": "a"}, "lines": {"text": "x\n"}, "line_number": number}
+                yield json.dumps({"type": "match", "data": match})
+            raise AssertionError("read past max_matches")
+
+        assert server._format_rg_json(events(), max_matches=2) == (1, 2, "a\n1:x\n2:x")
+
+    def test_run_rg_json_stops_endless_output(self):
+        """Test that the streamed command is stopped once enough matches are read."""
+        script = (
+            "import json\n"
+            "print(json.dumps({'type': 'begin', 'data': {'path': {'text': 'a'}}}), flush=True)\n"
+            "while True:\n"
+            "    data = {'path': {'text': 'a'}, 'lines': {'text': 'x'}, 'line_number': 1}\n"
+            "    print(json.dumps({'type': 'match', 'data': data}), flush=True)\n"
+        )
+
+        result = server._run_rg_json([sys.executable, "-c", script], max_matches=3, timeout=5)
+
+        assert result[:2] == (1, 3)
+
+    def test_run_rg_json_drains_large_stderr(self):
+        """Test that heavy stderr output (per-file errors) does not stall the search."""
+        script = (
+            "import json, sys\n"
+            "sys.stderr.write('permission denied\\n' * 20000)\n"
+            "print(json.dumps({'type': 'begin', 'data': {'path': {'text': 'a'}}}))\n"
+            "data = {'path': {'text': 'a'}, 'lines': {'text': 'x'}, 'line_number': 1}\n"
+            "print(json.dumps({'type': 'match', 'data': data}))\n"
+        )
+
+        result = server._run_rg_json([sys.executable, "-c", script], max_matches=5, timeout=5)
+
+        assert result[:2] == (1, 1)
+
+    def test_run_rg_json_errors(self):
+        """Test that error exits and timeouts surface as subprocess exceptions."""
+        failing = [sys.executable, "-c", "import sys; sys.stderr.write('bad regex'); sys.exit(2)"]
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            server._run_rg_json(failing, max_matches=5)
+        assert "bad regex" in exc_info.value.stderr
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            server._run_rg_json(
+                [sys.executable, "-c", "import time; time.sleep(30)"], max_matches=5, timeout=0.2
+            )
+
+
+class TestScanWorkspaceFiles:
+    """Test the directory walk behind list_workspace_files."""
+
+    def test_lists_matching_files_newest_first(self, tmp_path):
+        """Test filtering, exclusions, sizes and mtime ordering."""
+        (tmp_path / "notes").mkdir()
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "notes" / "old.md").write_text("old")
+        (tmp_path / "code.py").write_text("print()")
+        (tmp_path / ".gitignore").write_text("tmp/")
+        (tmp_path / ".git" / "HEAD.md").write_text("ref")
+        (tmp_path / "__pycache__" / "x.md").write_text("")
+        os.utime(tmp_path / "notes" / "old.md", (1_000, 1_000))
+
+        files = scan_workspace_files(tmp_path)
+
+        assert [(Path(path).relative_to(tmp_path).as_posix(), size) for path, size, _ in files] == [
+            ("code.py", 7),
+            ("notes/old.md", 3),
+        ]
+        assert files[1][2] == 1_000
+        assert [path for path, _, _ in scan_workspace_files(tmp_path, "*.md")] == [
+            str(tmp_path / "notes" / "old.md")
+        ]
+        assert len(scan_workspace_files(tmp_path, "notes/*")) == 1
+        assert scan_workspace_files(tmp_path, "*.MD") == []
+        assert [path for path, _, _ in scan_workspace_files(tmp_path, recursive=False)] == [
+            str(tmp_path / "code.py")
+        ]
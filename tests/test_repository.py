@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 from sqlmodel import Session, SQLModel, create_engine
 
-from taskmanager.models import Priority, Task, TaskStatus
+from taskmanager.models import Priority, Task, TaskStatus, TaskSummary
 from taskmanager.repository_impl import SQLTaskRepository
 
 
@@ -149,6 +149,55 @@ class TestSQLTaskRepository:
         page3 = repository.list_tasks(limit=10, offset=20)
         assert len(page3) == 5
 
+    def test_list_tasks_with_columns_defers_others(self, repository, session):
+        """Test that list_tasks(columns=...) only loads the requested columns."""
+        repository.create(Task(title="Summary", description="Long description"))
+        session.expunge_all()
+
+        tasks = repository.list_tasks(columns=("id", "title"))
+
+        assert tasks[0].title == "Summary"
+        assert "description" not in tasks[0].__dict__
+
+    def test_list_task_summaries(self, repository):
+        """Test that summary rows follow list_tasks filtering and ordering."""
+        repository.create(Task(title="Old", priority=Priority.HIGH, due_date=date(2025, 1, 1)))
+        repository.create(Task(title="Done", status=TaskStatus.COMPLETED))
+        repository.create(Task(title="New"))
+
+        summaries = repository.list_task_summaries(status=TaskStatus.PENDING)
+        tasks = repository.list_tasks(status=TaskStatus.PENDING)
+
+        assert [row.title for row in summaries] == [task.title for task in tasks]
+        assert summaries[-1] == TaskSummary(
+            summaries[-1].id, "Old", TaskStatus.PENDING, Priority.HIGH, date(2025, 1, 1)
+        )
+
+    def test_search_text(self, repository):
+        """Test that text search matches any text field literally."""
+        repository.create(Task(title="Fix Login bug"))
+        repository.create(Task(title="Other", description="see login page"))
+        repository.create(Task(title="Tagged", tags="login,auth", status=TaskStatus.COMPLETED))
+        repository.create(Task(title="100% done", jira_issues="SAS-1"))
+
+        titles = [task.title for task in repository.search_text("LOGIN")]
+        assert titles == ["Tagged", "Other", "Fix Login bug"]
+
+        assert [t.title for t in repository.search_text("Login", case_sensitive=True)] == [
+            "Fix Login bug"
+        ]
+        assert len(repository.search_text("login", status=TaskStatus.PENDING)) == 2
+        assert [t.title for t in repository.search_text("0%")] == ["100% done"]
+        assert repository.search_text("%") and not repository.search_text("_")
+
+    def test_search_text_folds_non_ascii_case(self, repository):
+        """Test that case-insensitive search folds non-ASCII letters like Python does."""
+        repository.create(Task(title="Écrire le rapport", tags="ÜBERSICHT"))
+
+        assert [t.title for t in repository.search_text("écrire")] == ["Écrire le rapport"]
+        assert len(repository.search_text("übersicht")) == 1
+        assert repository.search_text("écrire", case_sensitive=True) == []
+
     def test_count_tasks(self, repository):
         """Test counting tasks."""
         repository.create(Task(title="Task 1"))
@@ -175,6 +224,55 @@ class TestSQLTaskRepository:
         high_priority_count = repository.count_tasks(priority=Priority.HIGH)
         assert high_priority_count == 1
 
+    def test_count_by_status_and_priority(self, repository):
+        """Test grouped counts by status and priority."""
+        repository.create(Task(title="Pending", status=TaskStatus.PENDING))
+        repository.create(Task(title="Completed", status=TaskStatus.COMPLETED))
+        repository.create(
+            Task(title="High Priority", status=TaskStatus.COMPLETED, priority=Priority.HIGH)
+        )
+
+        assert repository.count_by_status() == {
+            TaskStatus.PENDING: 1,
+            TaskStatus.COMPLETED: 2,
+        }
+        assert repository.count_by_priority() == {Priority.MEDIUM: 2, Priority.HIGH: 1}
+
+    def test_count_overdue(self, repository):
+        """Test that only open tasks due before today are counted as overdue."""
+        today = date(2025, 6, 15)
+        repository.create(Task(title="Overdue", due_date=date(2025, 6, 1)))
+        repository.create(Task(title="Due today", due_date=today))
+        repository.create(Task(title="No due date"))
+        repository.create(
+            Task(title="Done late", due_date=date(2025, 6, 1), status=TaskStatus.COMPLETED)
+        )
+        repository.create(
+            Task(title="Cancelled late", due_date=date(2025, 6, 1), status=TaskStatus.CANCELLED)
+        )
+
+        assert repository.count_overdue(today) == 1
+
+    def test_count_summary(self, repository):
+        """Test that the combined summary matches the individual counts."""
+        today = date(2025, 6, 15)
+        repository.create(Task(title="Overdue", priority=Priority.HIGH, due_date=date(2025, 6, 1)))
+        repository.create(Task(title="Open", status=TaskStatus.IN_PROGRESS))
+        repository.create(
+            Task(title="Done late", due_date=date(2025, 6, 1), status=TaskStatus.COMPLETED)
+        )
+
+        by_status, by_priority, overdue = repository.count_summary(today)
+
+        assert by_status == repository.count_by_status()
+        assert by_status == {
+            TaskStatus.PENDING: 1,
+            TaskStatus.IN_PROGRESS: 1,
+            TaskStatus.COMPLETED: 1,
+        }
+        assert by_priority == {Priority.HIGH: 1, Priority.MEDIUM: 2}
+        assert overdue == 1
+
     def test_update_task(self, repository):
         """Test updating an existing task."""
         task = Task(title="Original Title")
@@ -223,6 +321,14 @@ class TestSQLTaskRepository:
         retrieved = repository.get_by_id(created.id)
         assert retrieved is None
 
+    def test_delete_returning_title(self, repository):
+        """Test that deleting returns the title, or None when nothing matched."""
+        created = repository.create(Task(title="To Delete"))
+
+        assert repository.delete_returning_title(created.id) == "To Delete"
+        assert repository.get_by_id(created.id) is None
+        assert repository.delete_returning_title(created.id) is None
+
     def test_delete_nonexistent_task(self, repository):
         """Test deleting a nonexistent task returns False."""
         result = repository.delete(999)
@@ -8,6 +8,7 @@ from sqlmodel import Session, SQLModel, create_engine
 from taskmanager.models import Priority, TaskStatus
 from taskmanager.repository_impl import SQLTaskRepository
 from taskmanager.service import TaskService
+from taskmanager.workspace import WorkspaceManager
 
 
 @pytest.fixture
@@ -192,6 +193,92 @@ class TestTaskServiceList:
         assert len(page2) == 10
         assert total == 25
 
+    def test_list_tasks_overdue_only(self, service):
+        """Test that overdue filtering happens in the query and in the total."""
+        yesterday = date.today() - timedelta(days=1)
+        service.create_task(title="Overdue", due_date=yesterday)
+        service.create_task(title="Done", due_date=yesterday, status=TaskStatus.COMPLETED)
+        service.create_task(title="Future", due_date=date.today() + timedelta(days=1))
+        service.create_task(title="No due date")
+
+        tasks, total = service.list_tasks(overdue_only=True)
+
+        assert total == 1
+        assert [task.title for task in tasks] == ["Overdue"]
+
+    def test_list_task_summaries(self, service):
+        """Test that summaries share list_tasks filters, total and validation."""
+        yesterday = date.today() - timedelta(days=1)
+        service.create_task(title="Overdue", due_date=yesterday)
+        service.create_task(title="No due date")
+
+        summaries, total = service.list_task_summaries(overdue_only=True)
+
+        assert total == 1
+        assert [row.title for row in summaries] == ["Overdue"]
+
+        with pytest.raises(ValueError, match="Limit must be between 1 and 100"):
+            service.list_task_summaries(limit=0)
+
+    def test_count_tasks(self, service):
+        """Test that count_tasks applies the list_tasks filters."""
+        yesterday = date.today() - timedelta(days=1)
+        service.create_task(title="Overdue", due_date=yesterday, priority=Priority.HIGH)
+        service.create_task(title="Done", due_date=yesterday, status=TaskStatus.COMPLETED)
+        service.create_task(title="No due date", priority=Priority.HIGH)
+
+        assert service.count_tasks() == 3
+        assert service.count_tasks(priority=Priority.HIGH) == 2
+        assert service.count_tasks(overdue_only=True) == 1
+        assert service.count_tasks(status=TaskStatus.COMPLETED, priority=Priority.HIGH) == 0
+
+    def test_list_tasks_total_from_short_page(self, service, monkeypatch):
+        """Test that the COUNT query only runs when the page can't give the total."""
+        for i in range(3):
+            service.create_task(title=f"Task {i}")
+        count_calls = []
+        count_tasks = service.repository.count_tasks
+        monkeypatch.setattr(
+            service.repository,
+            "count_tasks",
+            lambda **filters: count_calls.append(filters) or count_tasks(**filters),
+        )
+
+        assert service.list_tasks(limit=10)[1] == 3
+        assert service.list_task_summaries(limit=2, offset=2)[1] == 3
+        assert count_calls == []
+
+        assert service.list_tasks(limit=2)[1] == 3
+        assert service.list_task_summaries(offset=5)[1] == 3
+        assert len(count_calls) == 2
+
+    def test_search_tasks_reports_matched_fields(self, service):
+        """Test that search results name the fields containing the query."""
+        service.create_task(title="Deploy API", description="api gateway", tags="api")
+        service.create_task(title="Unrelated", jira_issues="API-7")
+        service.create_task(title="Nothing here")
+
+        results = service.search_tasks("api")
+
+        assert [(task.title, fields) for task, fields in results] == [
+            ("Unrelated", ["JIRA"]),
+            ("Deploy API", ["title", "description", "tags"]),
+        ]
+        assert [fields for _, fields in service.search_tasks("API", case_sensitive=True)] == [
+            ["JIRA"],
+            ["title"],
+        ]
+
+    def test_search_tasks_non_ascii_case_insensitive(self, service):
+        """Test that non-ASCII queries match regardless of case."""
+        service.create_task(title="Écrire le rapport")
+
+        results = service.search_tasks("écrire")
+
+        assert [(task.title, fields) for task, fields in results] == [
+            ("Écrire le rapport", ["title"])
+        ]
+
     def test_list_tasks_invalid_limit_raises_error(self, service):
         """Test that invalid limit raises ValueError."""
         with pytest.raises(ValueError, match="Limit must be between 1 and 100"):
@@ -341,6 +428,23 @@ class TestTaskServiceDelete:
             service.delete_task(0)
 
 
+class TestTaskServiceWorkspace:
+    """Tests for workspace creation and removal."""
+
+    def test_ensure_and_delete_workspace(self, service, tmp_path):
+        """Test that ensure creates only once and delete reports the old path."""
+        service.workspace_manager = WorkspaceManager(tmp_path)
+        task = service.create_task(title="Needs a workspace")
+
+        path, metadata = service.ensure_workspace(task.id, initialize_git=False)
+        assert path.is_dir() and metadata["workspace_path"] == str(path)
+        assert service.ensure_workspace(task.id) == (path, None)
+
+        assert service.delete_workspace_if_exists(task.id) == (path, True)
+        assert not path.exists()
+        assert service.delete_workspace_if_exists(task.id) == (None, False)
+
+
 class TestTaskServiceOverdue:
     """Tests for overdue task retrieval."""
 
@@ -383,6 +487,20 @@ class TestTaskServiceOverdue:
         assert "Overdue In Progress" in titles
 
 
+class TestTaskServiceParseDueDate:
+    """Tests for due date parsing."""
+
+    def test_parse_due_date(self):
+        """Test that YYYY-MM-DD strings parse to dates."""
+        assert TaskService.parse_due_date("2025-01-15") == date(2025, 1, 15)
+
+    def test_parse_due_date_invalid_raises_error(self):
+        """Test that malformed or non-YYYY-MM-DD input raises ValueError."""
+        for value in ["2025-13-01", "2025-02-30", "15/01/2025", "20250115", "2025-W03-3", ""]:
+            with pytest.raises(ValueError):
+                TaskService.parse_due_date(value)
+
+
 class TestTaskServiceStatistics:
     """Tests for task statistics."""
 
@@ -410,3 +528,17 @@ class TestTaskServiceStatistics:
         assert stats["high_priority"] == 1
         assert stats["urgent_priority"] == 1
         assert stats["medium_priority"] == 3  # Default priority
+
+    def test_get_stats(self, service):
+        """Test aggregated stats computed in SQL."""
+        yesterday = date.today() - timedelta(days=1)
+        service.create_task(title="Overdue", due_date=yesterday)
+        service.create_task(title="Done", status=TaskStatus.COMPLETED, due_date=yesterday)
+        service.create_task(title="High", priority=Priority.HIGH)
+
+        stats = service.get_stats()
+
+        assert stats.total == 3
+        assert stats.by_status == {TaskStatus.PENDING: 2, TaskStatus.COMPLETED: 1}
+        assert stats.by_priority == {Priority.MEDIUM: 2, Priority.HIGH: 1}
+        assert stats.overdue == 1